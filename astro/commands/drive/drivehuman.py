@@ -7,7 +7,7 @@ from wpilib.drive.differentialdrive import DifferentialDrive
 from wpilib.sendablechooser import SendableChooser
 from wpilib.smartdashboard import SmartDashboard
 
-from commands.drive.measure import Measure
+import telemetry
 
 # Dashboard control to select drive mode
 modeChooser : SendableChooser = None
@@ -32,7 +32,7 @@ class FlipFront(wpilib.command.InstantCommand):
 
     def updateDashboard(self):
         global isFlipped
-        SmartDashboard.putBoolean("Flipped Front", isFlipped)
+        telemetry.putBoolean("Flipped Front", isFlipped)
 
 class ToggleBrakeMode(wpilib.command.InstantCommand):
 
@@ -48,7 +48,7 @@ class ToggleBrakeMode(wpilib.command.InstantCommand):
 
     def updateDashboard(self):
         global enableBrakeMode
-        SmartDashboard.putBoolean("Brake Mode", enableBrakeMode)
+        telemetry.putBoolean("Brake Mode", enableBrakeMode)
 
 
 # Drive mode choices
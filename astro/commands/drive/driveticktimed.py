@@ -2,6 +2,8 @@ import wpilib
 from wpilib import SmartDashboard
 import subsystems
 import oi
+from perf import budget
+import telemetry
 
 class DriveTickTimed(wpilib.command.Command):
     """
@@ -53,10 +55,25 @@ class DriveTickTimed(wpilib.command.Command):
         self.rampTicks = 20
         self.cruiseTicks = 40
 
-        self.leftPower = oi.OI.initializeNumber(self.fixedLeftLabel, self.leftPower)
-        self.rightPower = oi.OI.initializeNumber(self.fixedRightLabel, self.rightPower)
-        self.rampTicks = int(oi.OI.initializeNumber(self.rampTicksLabel, self.rampTicks))
-        self.cruiseTicks = int(oi.OI.initializeNumber(self.cruiseTicksLabel, self.cruiseTicks))
+        DriveTickTimed.setupDashboardControls()
+
+        self.rampUpLeftEntry = telemetry.getEntry("Ramp Up Velocity (left)")
+        self.rampUpRightEntry = telemetry.getEntry("Ramp Up Velocity (right)")
+        self.cruiseLeftEntry = telemetry.getEntry("Cruise Velocity (left)")
+        self.cruiseRightEntry = telemetry.getEntry("Cruise Velocity (right)")
+        self.rampDownLeftEntry = telemetry.getEntry("Ramp Down Velocity (left)")
+        self.rampDownRightEntry = telemetry.getEntry("Ramp Down Velocity (right)")
+
+    @staticmethod
+    def setupDashboardControls():
+        """
+        Puts the drive settings on the dashboard (so they can be adjusted before
+        the command is ever constructed).
+        """
+        oi.OI.initializeNumber(DriveTickTimed.fixedLeftLabel, DriveTickTimed.kDefaultPower)
+        oi.OI.initializeNumber(DriveTickTimed.fixedRightLabel, DriveTickTimed.kDefaultPower)
+        oi.OI.initializeNumber(DriveTickTimed.rampTicksLabel, DriveTickTimed.rampTicks)
+        oi.OI.initializeNumber(DriveTickTimed.cruiseTicksLabel, DriveTickTimed.cruiseTicks)
 
     def initialize(self) -> None:
         """
@@ -96,23 +113,26 @@ class DriveTickTimed(wpilib.command.Command):
             rampPower: float = float(self.ticks) / float(self.rampTicks)
             subsystems.drive.setPower(self.leftPower * rampPower, self.rightPower * rampPower)
             self.checkModeChange(self.cruise, self.rampTicks)
-            SmartDashboard.putNumber("Ramp Up Velocity (left)", subsystems.drive.getLeft().getVelocity())
-            SmartDashboard.putNumber("Ramp Up Velocity (right)", subsystems.drive.getRight().getVelocity())
+            if budget.instance.allow(budget.kTelemetry):
+                self.rampUpLeftEntry.setNumber(subsystems.drive.getLeft().getVelocity())
+                self.rampUpRightEntry.setNumber(subsystems.drive.getRight().getVelocity())
 
         elif self.mode == self.cruise:
             subsystems.drive.setPower(self.leftPower, self.rightPower)
             self.checkModeChange(self.rampDown, self.cruiseTicks)
             # We hope these values remain close to the same
-            SmartDashboard.putNumber("Cruise Velocity (left)", subsystems.drive.getLeft().getVelocity())
-            SmartDashboard.putNumber("Cruise Velocity (right)", subsystems.drive.getRight().getVelocity())
+            if budget.instance.allow(budget.kTelemetry):
+                self.cruiseLeftEntry.setNumber(subsystems.drive.getLeft().getVelocity())
+                self.cruiseRightEntry.setNumber(subsystems.drive.getRight().getVelocity())
 
         elif self.mode == self.rampDown:
             rampPower = float(self.rampTicks - self.ticks) / float(self.rampTicks)
             subsystems.drive.setPower(self.leftPower * rampPower, self.rightPower * rampPower)
             self.checkModeChange(self.done, self.rampTicks)
             # We want this to be at zero
-            SmartDashboard.putNumber("Ramp Down Velocity (left)", subsystems.drive.getLeft().getVelocity())
-            SmartDashboard.putNumber("Ramp Down Velocity (right)", subsystems.drive.getRight().getVelocity())
+            if budget.instance.allow(budget.kTelemetry):
+                self.rampDownLeftEntry.setNumber(subsystems.drive.getLeft().getVelocity())
+                self.rampDownRightEntry.setNumber(subsystems.drive.getRight().getVelocity())
 
         else:
             subsystems.drive.stop()
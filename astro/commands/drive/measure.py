@@ -1,6 +1,7 @@
 import subsystems
 import wpilib
-from wpilib.smartdashboard import SmartDashboard
+from perf import budget
+import telemetry
 
 class Measure(wpilib.command.Command):
     """ Utility command that measures drive distance and rotation (zeros each time it is started). """
@@ -12,6 +13,23 @@ class Measure(wpilib.command.Command):
         self.left = self.drive.getLeft()
         self.right = self.drive.getRight()
         self.setRunWhenDisabled(True)
+        self.yawRawEntry = telemetry.getEntry("Yaw NavX")
+        self.yawEntry = telemetry.getEntry("Yaw Measured")
+        self.leftDistEntry = telemetry.getEntry("Left Dist")
+        self.leftCntsEntry = telemetry.getEntry("Left Cnts")
+        self.leftVelEntry = telemetry.getEntry("Left Vel")
+        self.rightDistEntry = telemetry.getEntry("Right Dist")
+        self.rightCntsEntry = telemetry.getEntry("Right Cnts")
+        self.rightVelEntry = telemetry.getEntry("Right Vel")
+        self.accelXEntry = telemetry.getEntry("Accel X")
+        self.accelYEntry = telemetry.getEntry("Accel Y")
+        self.bumpEntry = telemetry.getEntry("Bump")
+
+        # Ignore sensor noise when deciding if a value needs to be sent again
+        self.leftVelEntry.setEpsilon(0.01)
+        self.rightVelEntry.setEpsilon(0.01)
+        self.accelXEntry.setEpsilon(0.005)
+        self.accelYEntry.setEpsilon(0.005)
 
     def initialize(self):
         """ Takes initial values of things measurements to "zero" each time the command is started. """ 
@@ -22,6 +40,9 @@ class Measure(wpilib.command.Command):
         self.rightCntsLast = self.right.getCounts()
 
     def execute(self):
+        # Everything here is dashboard output, skip if loop is running long
+        if not budget.instance.allow(budget.kTelemetry):
+            return
         yawRaw = self.drive.getAngle()
         yaw = yawRaw - self.yawLast
         leftDist = self.left.getDistance() - self.leftDistLast
@@ -31,18 +52,18 @@ class Measure(wpilib.command.Command):
         rightCnts = self.right.getCounts() - self.rightCntsLast
         rightVel = self.right.getVelocity()
 
-        SmartDashboard.putNumber("Yaw NavX", yawRaw)
-        SmartDashboard.putNumber("Yaw Measured", yaw)
-        SmartDashboard.putNumber("Left Dist", leftDist)
-        SmartDashboard.putNumber("Left Cnts", leftCnts)
-        SmartDashboard.putNumber("Left Vel", leftVel)
-        SmartDashboard.putNumber("Right Dist", rightDist)
-        SmartDashboard.putNumber("Right Cnts", rightCnts)
-        SmartDashboard.putNumber("Right Vel", rightVel)
+        self.yawRawEntry.setNumber(yawRaw)
+        self.yawEntry.setNumber(yaw)
+        self.leftDistEntry.setNumber(leftDist)
+        self.leftCntsEntry.setNumber(leftCnts)
+        self.leftVelEntry.setNumber(leftVel)
+        self.rightDistEntry.setNumber(rightDist)
+        self.rightCntsEntry.setNumber(rightCnts)
+        self.rightVelEntry.setNumber(rightVel)
 
-        SmartDashboard.putNumber("Accel X", subsystems.drive.getAccelX())
-        SmartDashboard.putNumber("Accel Y", subsystems.drive.getAccelY())
-        SmartDashboard.putBoolean("Bump", subsystems.drive.bumpCheck())
+        self.accelXEntry.setNumber(subsystems.drive.getAccelX())
+        self.accelYEntry.setNumber(subsystems.drive.getAccelY())
+        self.bumpEntry.setBoolean(subsystems.drive.bumpCheck())
 
     def isFinished(self):
         return False
@@ -0,0 +1,57 @@
+import importlib
+import wpilib
+
+class LazyCommand(wpilib.command.Command):
+    """
+    Stand in for a command that is not built (or even imported) until it is needed.
+
+    Put a LazyCommand on the dashboard (or in a chooser) in place of the real
+    command. The command's module is imported and the command is constructed the
+    first time it is started (or get() is called) and reused after that, so start
+    up does not pay for commands that are never used.
+
+    Starting the LazyCommand starts the real command and the LazyCommand keeps
+    running (so the dashboard button shows its state) until the real command
+    stops. Canceling the LazyCommand cancels the real command.
+    """
+    def __init__(self, name: str, module: str, cls: str, *args):
+        """
+        : param name : Name of command (shown on dashboard).
+        : param module : Module holding command class (like "commands.drive.measure").
+        : param cls : Name of command class in module (like "Measure").
+        : param args : Arguments to pass to the command's constructor.
+        """
+        super().__init__(name)
+        self.module: str = module
+        self.cls: str = cls
+        self.args = args
+        self.command: wpilib.command.Command = None
+        # Set when started until the scheduler has had a chance to add the real command
+        self.pending: bool = False
+        # Real command enforces its own run when disabled setting
+        self.setRunWhenDisabled(True)
+
+    def isBuilt(self) -> bool:
+        """ Returns True if the real command has been constructed. """
+        return self.command != None
+
+    def get(self) -> wpilib.command.Command:
+        """ Returns the real command (importing its module and constructing it on the first call). """
+        if self.command == None:
+            cls = getattr(importlib.import_module(self.module), self.cls)
+            self.command = cls(*self.args)
+        return self.command
+
+    def initialize(self):
+        self.get().start()
+        self.pending = True
+
+    def isFinished(self) -> bool:
+        # Real command is not added until the scheduler processes additions
+        if self.pending:
+            self.pending = False
+            return False
+        return not self.command.isRunning()
+
+    def interrupted(self):
+        self.command.cancel()
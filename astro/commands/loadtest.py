@@ -1,69 +1,139 @@
 
 import wpilib
-import math
 from wpilib.smartdashboard import SmartDashboard
+from perf.benchmark import BenchmarkSuite, Result
+from perf.kernels import createKernels, synthetic
+from perf.files import getOutputPath
+from perf.background import BackgroundLoad, kNone, kThread, kProcess
 from math5511.stats import Stats
+from commands.performance import Performance
 
 class LoadTest(wpilib.command.Command):
-    """ Runs a set of operations to test performance. """
+    """
+    Runs a suite of benchmark kernels to test performance.
+
+    Each execute() runs at most one trial (about 50 ms) so the robot loop keeps
+    running. Results are published to the dashboard and written to loadtest.json
+    when done.
+    """
     def __init__(self):
         super().__init__("LoadTest")
-        self.previousBelow: bool = False
-        self.loopCnts: int = 8096
-        self.runSecs: float = 0
-        self.timer: wpilib.Timer = wpilib.Timer()
-        self.stats: Stats = Stats()
+        self.suite: BenchmarkSuite = None
+        self.steps = None
+        self.done: bool = False
         self.setRunWhenDisabled(True)
 
-    def runTest(self, cnt) -> float:
-        accum: float = 0.0
-        for i in range(0, cnt):
-            n: int = int(i / 4)
-            for j in range(0, n):
-                x = int((int(j >> 3) + 1) * 7 / 8)
-                if j % 4:
-                    x = -x
-                self.stats.add(x)
+    def initialize(self):
+        """ Reset for next run. """
+        self.suite = BenchmarkSuite(createKernels())
+        self.steps = self.suite.steps()
+        self.done = False
+
+    def execute(self):
+        """ Run the next piece of the benchmark suite. """
+        try:
+            next(self.steps)
+        except StopIteration:
+            self.done = True
+
+    def isFinished(self):
+        return self.done
+
+    def end(self):
+        if not self.done:
+            return
+        for r in self.suite.results:
+            SmartDashboard.putNumber("Bench " + r.name + " ns", r.getNsPerOp())
+            if r.speedup > 0:
+                SmartDashboard.putNumber("Bench " + r.name + " speedup", r.speedup)
+        syntheticResult: Result = self.suite.getResult("synthetic")
+        SmartDashboard.putNumber("CPU Test Loops", syntheticResult.iterations)
+        SmartDashboard.putNumber("CPU Test Secs", syntheticResult.getMean())
+        SmartDashboard.putNumber("CPU Test Hz", syntheticResult.getOpsPerSec())
+        path: str = getOutputPath("loadtest.json")
+        self.suite.write(path)
+        print("Wrote benchmark results to " + path)
+
+
+class InterferenceTest(wpilib.command.Command):
+    """
+    Measures robot loop timing while the synthetic kernel runs in the background
+    at several duty cycles, first on a thread (competes for the GIL) and then
+    in a separate process.
+    """
 
-            ratio = float(i) / cnt
-            accum += math.sin(ratio)
-            accum += math.pow(math.pi, ratio)
-            accum += math.cos(ratio)
-            self.stats.add(accum)
+    # Background load configurations (kind, duty cycle) to step through
+    kConfigs = (
+        (kNone, 0.0),
+        (kThread, 0.25), (kThread, 0.5), (kThread, 1.0),
+        (kProcess, 0.25), (kProcess, 0.5), (kProcess, 1.0)
+    )
 
-        return accum
+    # Labels for SmartDashboard controls
+    secsLabel: str = "Interference Secs"
+
+    def __init__(self, performance: Performance):
+        """
+        : param performance : Performance monitor that the robot reports each loop time to.
+        """
+        super().__init__("InterferenceTest")
+        self.performance: Performance = performance
+        self.secs: float = SmartDashboard.getNumber(self.secsLabel, 5.0)
+        SmartDashboard.putNumber(self.secsLabel, self.secs)
+        self.stats: Stats = Stats(True)
+        self.timer: wpilib.Timer = wpilib.Timer()
+        self.load: BackgroundLoad = None
+        self.index: int = 0
+        self.rows: list = []
+        # Number of upcoming loop times to leave out of the statistics
+        self.skip: int = 0
+        self.setRunWhenDisabled(True)
 
     def initialize(self):
-        """ Reset for next run. """
-        self.previousBelow = False
-        self.runSecs = 0
-        self.loopCnts = 1
-        self.stats.zero()
+        self.secs = SmartDashboard.getNumber(self.secsLabel, self.secs)
+        self.rows = []
+        self.index = 0
+        self.startConfig()
+        # First execute() sees the loop before we started, then the one that started the load
+        self.skip = 2
 
-    def execute(self):
-        """ Measure how long it takes to run a bunch of iterations. """
-        SmartDashboard.putNumber("CPU Test Loops", self.loopCnts)
+    def startConfig(self):
+        kind, duty = self.kConfigs[self.index]
+        self.stats.zero()
+        self.load = BackgroundLoad(synthetic, kind, duty)
+        self.load.start()
+        # Next loop time includes stopping the prior load and starting this one, not interference
+        self.skip = 1
         self.timer.reset()
         self.timer.start()
-        self.runTest(self.loopCnts)
-        self.runSecs = self.timer.get()
 
-    def isFinished(self):
-        """ Keep running until we cross over from too short of time to too long of time. """
-        if self.runSecs > 0.1:
-            if self.previousBelow:
-                return True
-            self.previousBelow = False
-            self.loopCnts = int(self.loopCnts / 2)
+    def stopConfig(self):
+        self.load.stop()
+        kind, duty = self.kConfigs[self.index]
+        p50, p99 = self.stats.getPercentiles((50, 99))
+        self.rows.append("%-8s %5.0f%% %8.2f %8.2f %8.2f" % (kind, duty * 100, p50, p99, self.stats.getMax()))
+
+    def execute(self):
+        # Time of the previous loop iteration (execute runs before it is updated)
+        if self.skip > 0:
+            self.skip -= 1
         else:
-            self.previousBelow = True
-            self.loopCnts = int(self.loopCnts * 2)
-        return False
+            self.stats.add(self.performance.last)
+        if self.timer.hasPeriodPassed(self.secs):
+            self.stopConfig()
+            self.index += 1
+            if self.index < len(self.kConfigs):
+                self.startConfig()
+
+    def isFinished(self):
+        return self.index >= len(self.kConfigs)
 
     def end(self):
-        hz = 0
-        if self.runSecs > 0:
-            hz = self.loopCnts / self.runSecs
-        SmartDashboard.putNumber("CPU Test Secs", self.runSecs)
-        SmartDashboard.putNumber("CPU Test Hz", hz)
+        table = [ "%-8s %6s %8s %8s %8s" % ("Load", "Duty", "P50 ms", "P99 ms", "Max ms") ] + self.rows
+        SmartDashboard.putStringArray("Interference Table", table)
+        print("\n".join(table))
 
+    def interrupted(self):
+        if self.index < len(self.kConfigs):
+            self.load.stop()
+        self.end()
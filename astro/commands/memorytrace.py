@@ -0,0 +1,76 @@
+
+import tracemalloc
+import wpilib
+from wpilib.smartdashboard import SmartDashboard
+
+# Number of stack frames to keep per allocation (more frames costs more memory/CPU)
+kFrames: int = 4
+
+# Ignore allocations made by the tracing machinery itself
+kFilters = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+class MemoryTrace(wpilib.command.Command):
+    """
+    Traces allocations while running and reports the top allocation sites that
+    grew between robot mode transitions (the robot calls snapshot() at each one).
+    """
+
+    # Number of allocation sites to report for each transition
+    kTopCount: int = 10
+
+    def __init__(self):
+        super().__init__("MemoryTrace")
+        self.previous: tracemalloc.Snapshot = None
+        self.previousLabel: str = None
+        self.setRunWhenDisabled(True)
+
+    def initialize(self):
+        """ Start tracing and take the initial snapshot. """
+        tracemalloc.start(kFrames)
+        self.previous = None
+        self.snapshot("Start")
+
+    def snapshot(self, label: str):
+        """
+        Takes a snapshot and reports growth since the prior one (does nothing if not tracing).
+        : param label : Name of point in time (typically the mode being entered).
+        """
+        if not tracemalloc.is_tracing():
+            return
+        snap = tracemalloc.take_snapshot().filter_traces(kFilters)
+        if self.previous != None:
+            self.report(self.previousLabel + " -> " + label, snap.compare_to(self.previous, "lineno"))
+        self.previous = snap
+        self.previousLabel = label
+
+    def report(self, title: str, diffs: list):
+        """ Publishes and prints the allocation sites that grew the most. """
+        grew = [d for d in diffs if d.size_diff > 0][:self.kTopCount]
+        lines = []
+        for d in grew:
+            frame = d.traceback[0]
+            lines.append("%+.1f KiB %+d blocks %s:%d" % (d.size_diff / 1024.0, d.count_diff, frame.filename, frame.lineno))
+        current, peak = tracemalloc.get_traced_memory()
+        SmartDashboard.putStringArray("Alloc Growth", lines)
+        SmartDashboard.putString("Alloc Growth Span", title)
+        SmartDashboard.putNumber("Alloc Traced KiB", current / 1024.0)
+        SmartDashboard.putNumber("Alloc Peak KiB", peak / 1024.0)
+        print("Allocation growth " + title)
+        for line in lines:
+            print("  " + line)
+
+    def isFinished(self):
+        return False
+
+    def end(self):
+        """ Report growth since last snapshot then stop tracing. """
+        self.snapshot("Stop")
+        self.previous = None
+        tracemalloc.stop()
+
+    def interrupted(self):
+        self.end()
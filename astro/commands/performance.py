@@ -1,13 +1,25 @@
 
 import wpilib
-from wpilib.smartdashboard import SmartDashboard
-from math5511.stats import Stats
+from math5511.stats import Stats, WindowStats
+from perf.phases import PhaseTimer
+from perf import budget
+import telemetry
+
+# Number of loop iterations to keep rolling statistics on (~5 seconds at 50 Hz)
+kWindowSize: int = 250
 
 class Performance(wpilib.command.Command):
     """ Used to monitor how long it takes for code to run (helper class for main robot.py class). """
-    def __init__(self):
+    def __init__(self, phases: PhaseTimer = None):
+        """
+        : param phases : Optional per-phase timer of the loop to publish a breakdown of.
+        """
         super().__init__("Performance")
-        self.stats: Stats = Stats()
+        self.phases: PhaseTimer = phases
+        # Histogram enabled so we can publish tail latency (fixed memory for entire match)
+        self.stats: Stats = Stats(True)
+        # Rolling statistics so we see recent loop health instead of since boot
+        self.window: WindowStats = WindowStats(kWindowSize)
         self.last: float = 0
         self.setRunWhenDisabled(True)
 
@@ -18,17 +30,33 @@ class Performance(wpilib.command.Command):
         """
         self.last = timeSecs * 1000.0
         self.stats.add(self.last)
+        self.window.add(self.last)
 
     def initialize(self):
         """ Reset the statistics each time this command is started. """
         self.last = 0
         self.stats.zero()
+        self.window.zero()
+        if self.phases != None:
+            self.phases.zero()
 
     def execute(self):
-        """ Show accumulated statistics that we care about. """
-        SmartDashboard.putNumber("Run Last", self.last)
-        SmartDashboard.putNumber("Run Avg", self.stats.getAvg())
-        SmartDashboard.putNumber("Run Max", self.stats.getMax())
+        """ Show accumulated statistics that we care about (deferred if loop is running long). """
+        if not budget.instance.allow(budget.kDiagnostics):
+            return
+        telemetry.putNumber("Run Last", self.last)
+        telemetry.putNumber("Run Avg", self.stats.getAvg())
+        telemetry.putNumber("Run Max", self.stats.getMax())
+        p50, p95, p99 = self.stats.getPercentiles((50, 95, 99))
+        telemetry.putNumber("Run P50", p50)
+        telemetry.putNumber("Run P95", p95)
+        telemetry.putNumber("Run P99", p99)
+        telemetry.putNumber("Run Avg (5s)", self.window.getAvg())
+        telemetry.putNumber("Run Max (5s)", self.window.getMax())
+        telemetry.putNumber("Run StdDev (5s)", self.window.getStdDev())
+        if self.phases != None:
+            telemetry.putString("Run Phases", self.phases.getSummary())
+        telemetry.putNumber("Dashboard Writes Skipped", telemetry.instance.skipped)
 
     def isFinished(self):
         return False
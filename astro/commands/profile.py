@@ -0,0 +1,55 @@
+
+import sys
+import wpilib
+from wpilib.smartdashboard import SmartDashboard
+from perf.profiler import CommandProfiler
+
+class ProfileCommands(wpilib.command.Command):
+    """ Profiles command and subsystem methods while running (dumps table of results when stopped). """
+
+    # How many execute() calls between dashboard table updates
+    kPublishTicks: int = 50
+
+    # How many entries to show on the dashboard
+    kPublishLimit: int = 10
+
+    def __init__(self, profiler: CommandProfiler):
+        """
+        : param profiler : Profiler that has already instrumented the classes of interest.
+        """
+        super().__init__("ProfileCommands")
+        self.profiler: CommandProfiler = profiler
+        self.ticks: int = 0
+        self.setRunWhenDisabled(True)
+
+    def initialize(self):
+        """ Clear prior results and start profiling. """
+        self.ticks = 0
+        # Pick up command classes imported since start up (see commands.lazy)
+        self.profiler.instrumentAll()
+        # Lift helpers are worth timing too, but only if lift commands have been loaded
+        lift = sys.modules.get("commands.lift")
+        if lift != None:
+            self.profiler.instrumentClass(lift.LiftCommand, ("maintainBackLegs", "fullyExtendBothLegs"))
+        self.profiler.zero()
+        self.profiler.enabled = True
+
+    def execute(self):
+        self.ticks += 1
+        if (self.ticks % self.kPublishTicks) == 0:
+            self.publish()
+
+    def publish(self):
+        SmartDashboard.putStringArray("Profile Table", self.profiler.getTable(self.kPublishLimit))
+
+    def isFinished(self):
+        return False
+
+    def end(self):
+        """ Stop profiling and dump the full sorted table to the console. """
+        self.profiler.enabled = False
+        self.publish()
+        print("\n".join(self.profiler.getTable()))
+
+    def interrupted(self):
+        self.end()
@@ -0,0 +1,39 @@
+
+import wpilib
+from wpilib.smartdashboard import SmartDashboard
+from perf.sampler import StackSampler
+from perf.files import getOutputPath
+
+class SampleProfile(wpilib.command.Command):
+    """ Samples the main robot thread's stack while running and writes a flame graph file when stopped. """
+
+    # Labels for SmartDashboard controls
+    rateLabel: str = "Sample Hz"
+
+    def __init__(self):
+        """ Must be constructed on the main robot thread (that is the thread sampled). """
+        super().__init__("SampleProfile")
+        self.sampler: StackSampler = StackSampler()
+        self.sampler.hz = SmartDashboard.getNumber(self.rateLabel, self.sampler.hz)
+        SmartDashboard.putNumber(self.rateLabel, self.sampler.hz)
+        self.setRunWhenDisabled(True)
+
+    def initialize(self):
+        """ Clear prior samples and start sampling at rate from dashboard. """
+        self.sampler.zero()
+        self.sampler.hz = max(1.0, SmartDashboard.getNumber(self.rateLabel, self.sampler.hz))
+        self.sampler.start()
+
+    def isFinished(self):
+        return False
+
+    def end(self):
+        """ Stop sampling and write results in folded stack format. """
+        self.sampler.stop()
+        path: str = getOutputPath("profile.folded")
+        stacks: int = self.sampler.write(path)
+        SmartDashboard.putNumber("Sample Count", self.sampler.samples)
+        print("Wrote %d stacks (%d samples) to %s" % (stacks, self.sampler.samples, path))
+
+    def interrupted(self):
+        self.end()
@@ -0,0 +1,154 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Number of controllers configured at the same time
+kWorkers: int = 8
+
+class Setting():
+    """ A single configuration call (method name and arguments) to make on a controller. """
+
+    __slots__ = ("method", "args", "verify", "expected", "secs")
+
+    def __init__(self, method: str, args: tuple, verify: str, expected):
+        self.method: str = method
+        self.args: tuple = args
+        # Name of method that reads the setting back (None if it can't be checked)
+        self.verify: str = verify
+        self.expected = expected
+        # Seconds the call took the last time it was applied
+        self.secs: float = 0.0
+
+
+class ControllerConfig():
+    """ All of the settings for one motor controller (applied in the order added). """
+    def __init__(self, controller, label: str):
+        """
+        : param controller : Motor controller (or anything else) to configure.
+        : param label : Name used when reporting times and failures (like "Talon10").
+        """
+        self.controller = controller
+        self.label: str = label
+        self.settings: list = []
+        # Seconds the last apply() took
+        self.secs: float = 0.0
+        # Descriptions of calls that failed on the last apply()/verify()
+        self.failures: list = []
+
+    def add(self, method: str, *args, verify: str = None, expected = None):
+        """
+        Adds a configuration call.
+
+        : param method : Name of method to call (like "configOpenLoopRamp").
+        : param args : Arguments to pass.
+        : param verify : Optional name of method that reads the setting back (like "getInverted").
+        : param expected : Value verify method should return (defaults to first argument).
+        """
+        if verify != None and expected == None:
+            expected = args[0]
+        self.settings.append(Setting(method, args, verify, expected))
+        return self
+
+    def apply(self):
+        """ Makes all of the configuration calls (config calls returning a non-zero error code are failures). """
+        t0: float = time.perf_counter()
+        self.failures = []
+        for s in self.settings:
+            t1: float = time.perf_counter()
+            try:
+                result = getattr(self.controller, s.method)(*s.args)
+            except Exception as e:
+                self.failures.append("%s.%s raised %s" % (self.label, s.method, e))
+                continue
+            finally:
+                s.secs = time.perf_counter() - t1
+            # Phoenix config calls return an ErrorCode (0 is OK)
+            if isinstance(result, int) and not isinstance(result, bool) and result != 0:
+                self.failures.append("%s.%s returned %d" % (self.label, s.method, result))
+        self.secs = time.perf_counter() - t0
+
+    def verify(self) -> bool:
+        """ Reads back settings that can be checked, returns True if all calls succeeded and all values match. """
+        for s in self.settings:
+            if s.verify == None:
+                continue
+            try:
+                actual = getattr(self.controller, s.verify)()
+            except Exception as e:
+                self.failures.append("%s.%s raised %s" % (self.label, s.verify, e))
+                continue
+            if actual != s.expected:
+                self.failures.append("%s.%s is %s (expected %s)" % (self.label, s.verify, actual, s.expected))
+        return len(self.failures) == 0
+
+
+class Configurator():
+    """
+    Configures motor controllers at start up.
+
+    Each configuration call to a controller blocks until the controller
+    acknowledges it (or the timeout expires), so configuring controllers one at
+    a time makes start up grow with the number of controllers. Instead, code
+    constructing controllers queues each controller's settings with add() and
+    run() applies them from a thread pool (settings for one controller are
+    still applied in order), then reads back the settings that can be checked.
+    Controllers that fail are given one more serial attempt.
+    """
+    def __init__(self, workers: int = kWorkers):
+        """
+        : param workers : Maximum number of controllers to configure at the same time.
+        """
+        self.workers: int = workers
+        # Controllers waiting for run()
+        self.pending: list = []
+        # Controllers handled by the last run()
+        self.configs: list = []
+        # Wall clock seconds the last run() took
+        self.elapsed: float = 0.0
+        # Descriptions of settings that still failed after the retry
+        self.failures: list = []
+
+    def add(self, controller, label: str) -> ControllerConfig:
+        """
+        Queues a controller to be configured by the next run().
+
+        : param controller : Motor controller to configure.
+        : param label : Name used when reporting times and failures (like "Talon10").
+        : return : Object to add the controller's settings to.
+        """
+        config: ControllerConfig = ControllerConfig(controller, label)
+        self.pending.append(config)
+        return config
+
+    def run(self) -> bool:
+        """
+        Applies all queued settings and verifies them.
+        : return : True if all controllers were configured successfully.
+        """
+        t0: float = time.perf_counter()
+        self.configs = self.pending
+        self.pending = []
+        self.failures = []
+        if len(self.configs) > 0:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(self.configs))) as pool:
+                # list() waits for every apply (and raises anything unexpected)
+                list(pool.map(ControllerConfig.apply, self.configs))
+        for config in self.configs:
+            if not config.verify():
+                # Try once more on its own before reporting failure
+                config.apply()
+                if not config.verify():
+                    self.failures.extend(config.failures)
+        self.elapsed = time.perf_counter() - t0
+        return len(self.failures) == 0
+
+    def getSerialSecs(self) -> float:
+        """ Returns seconds the last run() would have taken if controllers were configured one at a time. """
+        return sum(config.secs for config in self.configs)
+
+    def getTable(self) -> list:
+        """ Returns formatted "ms label" lines showing how long each controller took to configure. """
+        return [ "%8.2f %s" % (config.secs * 1000.0, config.label) for config in self.configs ]
+
+
+""" Single instance used by subsystems to queue controller settings (run by subsystems.initialize()) """
+instance: Configurator = Configurator()
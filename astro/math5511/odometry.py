@@ -0,0 +1,188 @@
+import math
+
+# Number of poses kept for lookups by time (1 second at 50 Hz)
+kHistorySize: int = 50
+
+def normalizeDegrees(angle: float) -> float:
+    """ Returns angle wrapped into the range of [-180, +180). """
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+class Pose():
+    """
+    Position (ft) and heading (degrees) of the robot on the field at a point in time.
+
+    Heading uses the NavX convention (increases when turning clockwise as seen
+    from above) and y increases to the robot's right when heading is 0. This
+    matches the field pyfrc's physics simulation draws.
+    """
+
+    __slots__ = ("timestamp", "x", "y", "heading")
+
+    def __init__(self, timestamp: float = 0.0, x: float = 0.0, y: float = 0.0, heading: float = 0.0):
+        self.timestamp: float = timestamp
+        self.x: float = x
+        self.y: float = y
+        self.heading: float = heading
+
+    def set(self, timestamp: float, x: float, y: float, heading: float):
+        self.timestamp = timestamp
+        self.x = x
+        self.y = y
+        self.heading = heading
+        return self
+
+    def __repr__(self) -> str:
+        return "Pose(%.3f, %.3f, %.3f, %.2f)" % (self.timestamp, self.x, self.y, self.heading)
+
+
+class Twist():
+    """ How fast the robot is moving forward (ft/sec) and turning (degrees/sec, clockwise positive). """
+
+    __slots__ = ("velocity", "rate")
+
+    def __init__(self):
+        self.velocity: float = 0.0
+        self.rate: float = 0.0
+
+
+class Odometry():
+    """
+    Tracks the pose of a differential (tank) drive from its encoder distances and gyro.
+
+    Each update() moves the pose by the average of the left and right distance
+    changes along the heading half way between the prior and current gyro
+    readings (exact for straight lines and a close approximation of arcs at
+    loop rates). Poses are recorded in a preallocated ring so the pose at an
+    earlier time (like when a camera frame was captured) can be interpolated.
+    """
+    def __init__(self, historySize: int = kHistorySize):
+        """
+        : param historySize : Number of most recent poses to keep (at least 2).
+        """
+        self.__size: int = max(2, historySize)
+        self.__poses: list = [ Pose() for _ in range(self.__size) ]
+        # Total number of poses recorded (ring position of next is __added % __size)
+        self.__added: int = 0
+        self.pose: Pose = Pose()
+        self.twist: Twist = Twist()
+        # Encoder distances and gyro angle from last update
+        self.leftDist: float = 0.0
+        self.rightDist: float = 0.0
+        self.gyroAngle: float = 0.0
+        # Added to gyro angle to get heading on field
+        self.gyroOffset: float = 0.0
+
+    def reset(self, timestamp: float, x: float, y: float, heading: float, leftDist: float, rightDist: float, gyroAngle: float):
+        """
+        Sets the current pose (and forgets the history).
+
+        : param timestamp : Time (secs) of readings.
+        : param x : Field position (ft).
+        : param y : Field position (ft).
+        : param heading : Field heading (degrees).
+        : param leftDist : Current left encoder distance (ft).
+        : param rightDist : Current right encoder distance (ft).
+        : param gyroAngle : Current gyro angle (degrees).
+        """
+        self.gyroOffset = heading - gyroAngle
+        self.resetEncoders(leftDist, rightDist)
+        self.gyroAngle = gyroAngle
+        self.pose.set(timestamp, x, y, normalizeDegrees(heading))
+        self.twist.velocity = self.twist.rate = 0.0
+        self.__added = 0
+        self.__record__()
+
+    def resetEncoders(self, leftDist: float, rightDist: float):
+        """ Call after zeroing encoders so the jump in distance is not treated as movement. """
+        self.leftDist = leftDist
+        self.rightDist = rightDist
+
+    def update(self, timestamp: float, leftDist: float, rightDist: float, gyroAngle: float) -> Pose:
+        """
+        Moves the pose by the change in readings since the last update.
+
+        : param timestamp : Time (secs) readings were taken.
+        : param leftDist : Left encoder distance (ft).
+        : param rightDist : Right encoder distance (ft).
+        : param gyroAngle : Gyro angle (degrees, may be wrapped).
+        : return : The updated pose (reused each update, copy values to keep them).
+        """
+        pose: Pose = self.pose
+        dist: float = ((leftDist - self.leftDist) + (rightDist - self.rightDist)) * 0.5
+        turn: float = normalizeDegrees(gyroAngle - self.gyroAngle)
+        mid: float = math.radians(pose.heading + turn * 0.5)
+        dt: float = timestamp - pose.timestamp
+        pose.x += dist * math.cos(mid)
+        pose.y += dist * math.sin(mid)
+        pose.heading = normalizeDegrees(gyroAngle + self.gyroOffset)
+        pose.timestamp = timestamp
+        if dt > 0:
+            self.twist.velocity = dist / dt
+            self.twist.rate = turn / dt
+        self.leftDist = leftDist
+        self.rightDist = rightDist
+        self.gyroAngle = gyroAngle
+        self.__record__()
+        return pose
+
+    def __record__(self):
+        pose: Pose = self.pose
+        self.__poses[self.__added % self.__size].set(pose.timestamp, pose.x, pose.y, pose.heading)
+        self.__added += 1
+
+    def getPose(self) -> Pose:
+        """ Returns current pose (treat as read only). """
+        return self.pose
+
+    def getTwist(self) -> Twist:
+        """ Returns velocity and turn rate from the last update (treat as read only). """
+        return self.twist
+
+    def getCount(self) -> int:
+        """ Returns number of poses in history. """
+        return min(self.__added, self.__size)
+
+    def getHistory(self, age: int = 0) -> Pose:
+        """
+        : param age : 0 for latest pose recorded, 1 for the one before it, etc (clamped to oldest available).
+        """
+        age = min(age, self.getCount() - 1)
+        return self.__poses[(self.__added - 1 - age) % self.__size]
+
+    def getPoseAt(self, timestamp: float, out: Pose) -> Pose:
+        """
+        Interpolates the pose at an earlier time (clamped to the oldest and newest poses kept).
+
+        : param timestamp : Time (secs) to look up.
+        : param out : Pose to fill in (reuse one to avoid allocating).
+        : return : The out pose.
+        """
+        cnt: int = self.getCount()
+        if cnt == 0:
+            pose: Pose = self.pose
+            return out.set(timestamp, pose.x, pose.y, pose.heading)
+        newer: Pose = self.getHistory(0)
+        if timestamp >= newer.timestamp:
+            return out.set(timestamp, newer.x, newer.y, newer.heading)
+        # Binary search for the newest pose at or before timestamp (ages grow going back in time)
+        lo: int = 0
+        hi: int = cnt - 1
+        if timestamp <= self.getHistory(hi).timestamp:
+            older: Pose = self.getHistory(hi)
+            return out.set(timestamp, older.x, older.y, older.heading)
+        while hi - lo > 1:
+            mid: int = (lo + hi) // 2
+            if self.getHistory(mid).timestamp > timestamp:
+                lo = mid
+            else:
+                hi = mid
+        newer = self.getHistory(lo)
+        older = self.getHistory(hi)
+        span: float = newer.timestamp - older.timestamp
+        frac: float = 0.0
+        if span > 0:
+            frac = (timestamp - older.timestamp) / span
+        turn: float = normalizeDegrees(newer.heading - older.heading)
+        return out.set(timestamp, older.x + (newer.x - older.x) * frac, older.y + (newer.y - older.y) * frac, \
+            normalizeDegrees(older.heading + turn * frac))
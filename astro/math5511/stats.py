@@ -1,6 +1,120 @@
+import math
+from array import array
+from collections import deque
+
+# Default range and resolution of histogram buckets (values outside
+# the range are clamped into the first or last bucket)
+kHistLowest: float = 0.001
+kHistHighest: float = 10000.0
+kHistSubBuckets: int = 32
+
+class Histogram():
+    """
+    Fixed memory, log bucketed histogram (HDR style) used to estimate percentiles.
+
+    Values are split into power of 2 ranges (using the exponent from math.frexp)
+    and each range is divided into subBuckets linear buckets. This keeps the
+    relative error of a reported value under 1/subBuckets no matter how large
+    or small the value is. All counts live in a preallocated array so add()
+    is constant time and does not allocate.
+    """
+    def __init__(self, lowest: float = kHistLowest, highest: float = kHistHighest, subBuckets: int = kHistSubBuckets):
+        """
+        : param lowest : Smallest value (greater than 0) we care to resolve.
+        : param highest : Largest value we care to resolve.
+        : param subBuckets : Number of buckets per power of 2 (resolution).
+        """
+        self.__subBuckets: int = subBuckets
+        self.__minExp: int = math.frexp(lowest)[1]
+        self.__size: int = (math.frexp(highest)[1] - self.__minExp + 1) * subBuckets
+        self.__counts: array = array('l', [0]) * self.__size
+        self.__cnt: int = 0
+
+    def zero(self):
+        for i in range(self.__size):
+            self.__counts[i] = 0
+        self.__cnt = 0
+
+    def getCount(self) -> int:
+        return self.__cnt
+
+    def getBucketCount(self) -> int:
+        """ Returns the number of buckets (fixed at construction). """
+        return self.__size
+
+    def add(self, val: float):
+        """ Adds a value (infinities are clamped into the first or last bucket and NaN is ignored). """
+        mantissa, exp = math.frexp(val)
+        try:
+            idx: int = (exp - self.__minExp) * self.__subBuckets + int((mantissa - 0.5) * 2 * self.__subBuckets)
+        except (ValueError, OverflowError):
+            # Only reached for NaN (ValueError) or +/-inf (OverflowError)
+            if val != val:
+                return
+            idx = self.__size if val > 0 else 0
+        if idx < 0 or val <= 0:
+            idx = 0
+        elif idx >= self.__size:
+            idx = self.__size - 1
+        self.__counts[idx] += 1
+        self.__cnt += 1
+
+    def getBucketValue(self, idx: int) -> float:
+        """
+        Returns the upper bound of the values that land in a bucket.
+        : param idx : Bucket index in the range of [0, getBucketCount()).
+        """
+        exp: int = idx // self.__subBuckets + self.__minExp
+        sub: int = idx % self.__subBuckets
+        return math.ldexp(0.5 + 0.5 * (sub + 1) / self.__subBuckets, exp)
+
+    def getPercentiles(self, pcts) -> list:
+        """
+        Looks up several percentiles in a single pass over the buckets.
+
+        : param pcts : Sequence of percentiles in ascending order (like (50, 95, 99)).
+        : return : List of estimated values (upper bound of bucket) for each percentile.
+        """
+        vals: list = []
+        if self.__cnt == 0:
+            return [0.0] * len(pcts)
+        targets = [max(1, math.ceil(pct * self.__cnt / 100.0)) for pct in pcts]
+        t: int = 0
+        seen: int = 0
+        for idx in range(self.__size):
+            seen += self.__counts[idx]
+            while t < len(targets) and seen >= targets[t]:
+                vals.append(self.getBucketValue(idx))
+                t += 1
+            if t == len(targets):
+                break
+        return vals
+
+    def addMany(self, vals):
+        """ Adds each value from a sequence (see add()). """
+        for val in vals:
+            self.add(val)
+
+    def getPercentile(self, pct: float) -> float:
+        """
+        : param pct : Percentile to look up in the range of [0, 100].
+        : return : Estimated value such that pct percent of the values are at or below it.
+        """
+        return self.getPercentiles((pct,))[0]
+
+
 class Stats():
-    """ Helper class to track statistics (min, max, cnt, sum, avg). """
-    def __init__(self):
+    """ Helper class to track statistics (min, max, cnt, sum, avg) and optionally percentiles. """
+    def __init__(self, histogram: bool = False, lowest: float = kHistLowest, highest: float = kHistHighest, subBuckets: int = kHistSubBuckets):
+        """
+        : param histogram : Pass True to also track a Histogram so percentiles can be queried.
+        : param lowest : Smallest value histogram resolves (see Histogram).
+        : param highest : Largest value histogram resolves (see Histogram).
+        : param subBuckets : Histogram resolution (see Histogram).
+        """
+        self.__hist: Histogram = None
+        if histogram:
+            self.__hist = Histogram(lowest, highest, subBuckets)
         self.zero()
 
     def zero(self):
@@ -8,6 +122,8 @@ class Stats():
         self.__max : float = 0
         self.__cnt : int = 0
         self.__sum : float = 0
+        if self.__hist != None:
+            self.__hist.zero()
 
     def getMin(self) -> float:
         return self.__min
@@ -27,6 +143,25 @@ class Stats():
             avg = self.__sum / self.__cnt
         return avg
 
+    def getHistogram(self) -> Histogram:
+        """ Returns histogram being tracked (None if not constructed with histogram enabled). """
+        return self.__hist
+
+    def getPercentiles(self, pcts) -> list:
+        """
+        Returns estimated values for several percentiles (clamped to the min/max seen).
+
+        : param pcts : Sequence of percentiles in ascending order (like (50, 95, 99)).
+        : return : List of values (all 0 if histogram is not enabled).
+        """
+        if self.__hist == None:
+            return [0.0] * len(pcts)
+        return [min(max(v, self.__min), self.__max) for v in self.__hist.getPercentiles(pcts)]
+
+    def getPercentile(self, pct: float) -> float:
+        """ Returns estimated value for a single percentile (see getPercentiles()). """
+        return self.getPercentiles((pct,))[0]
+
     def add(self, val: float):
         if self.__cnt == 0:
             self.__min = self.__max = val
@@ -36,3 +171,129 @@ class Stats():
             self.__min = val
         self.__cnt += 1
         self.__sum += val
+        if self.__hist != None:
+            self.__hist.add(val)
+
+    def addMany(self, vals):
+        """
+        Adds a batch of values in one call.
+
+        : param vals : Sequence of values. NumPy arrays are reduced with their own
+        min()/max()/sum() methods so no per element Python work is done (unless
+        the histogram is enabled).
+        """
+        cnt: int = len(vals)
+        if cnt == 0:
+            return
+        if hasattr(vals, "sum"):
+            lo = float(vals.min())
+            hi = float(vals.max())
+            total = float(vals.sum())
+        else:
+            lo = min(vals)
+            hi = max(vals)
+            total = sum(vals)
+        if self.__cnt == 0:
+            self.__min = lo
+            self.__max = hi
+        else:
+            self.__min = min(self.__min, lo)
+            self.__max = max(self.__max, hi)
+        self.__cnt += cnt
+        self.__sum += total
+        if self.__hist != None:
+            self.__hist.addMany(vals)
+
+
+class WindowStats():
+    """
+    Helper class to track statistics (min, max, cnt, sum, avg, variance) over the
+    last N values added.
+
+    Values are kept in a preallocated ring buffer. Running sums give an O(1) mean
+    and variance and monotonic deques (of ring positions) give an amortized O(1)
+    min and max.
+    """
+    def __init__(self, size: int):
+        """
+        : param size : Number of most recent values to keep statistics on (at least 1).
+        """
+        if size < 1:
+            raise ValueError("WindowStats size must be at least 1 (got %s)" % size)
+        self.__size: int = size
+        self.__vals: array = array('d', [0.0]) * size
+        self.__mins: deque = deque()
+        self.__maxs: deque = deque()
+        self.zero()
+
+    def zero(self):
+        self.__mins.clear()
+        self.__maxs.clear()
+        # Total number of values ever added (ring position is __added % __size)
+        self.__added : int = 0
+        self.__sum : float = 0
+        self.__sumSq : float = 0
+
+    def getSize(self) -> int:
+        """ Returns maximum number of values kept in window. """
+        return self.__size
+
+    def getMin(self) -> float:
+        if self.__added == 0:
+            return 0
+        return self.__vals[self.__mins[0] % self.__size]
+
+    def getMax(self) -> float:
+        if self.__added == 0:
+            return 0
+        return self.__vals[self.__maxs[0] % self.__size]
+
+    def getCount(self) -> int:
+        return min(self.__added, self.__size)
+
+    def getSum(self) -> float:
+        return self.__sum
+
+    def getAvg(self) -> float:
+        avg: float = 0
+        cnt: int = self.getCount()
+        if cnt > 0:
+            avg = self.__sum / cnt
+        return avg
+
+    def getVariance(self) -> float:
+        """ Returns population variance of values in window. """
+        cnt: int = self.getCount()
+        if cnt == 0:
+            return 0
+        avg: float = self.__sum / cnt
+        # Guard against tiny negative values from floating point round off
+        return max(self.__sumSq / cnt - avg * avg, 0.0)
+
+    def getStdDev(self) -> float:
+        """ Returns population standard deviation of values in window. """
+        return math.sqrt(self.getVariance())
+
+    def add(self, val: float):
+        seq: int = self.__added
+        pos: int = seq % self.__size
+        if seq >= self.__size:
+            # Window full, drop oldest value from running sums and deques
+            old: float = self.__vals[pos]
+            self.__sum -= old
+            self.__sumSq -= old * old
+            oldest: int = seq - self.__size
+            if self.__mins[0] == oldest:
+                self.__mins.popleft()
+            if self.__maxs[0] == oldest:
+                self.__maxs.popleft()
+        self.__vals[pos] = val
+        self.__sum += val
+        self.__sumSq += val * val
+        while self.__mins and self.__vals[self.__mins[-1] % self.__size] >= val:
+            self.__mins.pop()
+        self.__mins.append(seq)
+        while self.__maxs and self.__vals[self.__maxs[-1] % self.__size] <= val:
+            self.__maxs.pop()
+        self.__maxs.append(seq)
+        self.__added = seq + 1
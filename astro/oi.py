@@ -1,4 +1,3 @@
-import wpilib
 from wpilib import SmartDashboard
 from wpilib.command import Command
 from wpilib.sendablechooser import SendableChooser
@@ -7,16 +6,15 @@ from wpilib.buttons.joystickbutton import JoystickButton
 
 import subsystems
 
-from commands.drive.measure import Measure
-from commands.drive.drivehuman import DriveHuman
 from commands.drive.driveticktimed import DriveTickTimed
-from commands.loadtest import LoadTest
-from commands.lift import ClimbUp, DriveToBackSensor, DriveToFrontSensor, ExtendBothLegs, RetractFrontLegs, RetractBackLegs
+# Other commands are imported and built on first use (keeps robot start up fast)
+from commands.lazy import LazyCommand
 
 class OI():
     debug: bool = True
     autonChooser: SendableChooser = None
     driver: Joystick = None
+    loadTest: LazyCommand = None
 
     def __init__(self):
         self.driver: Joystick = Joystick(0)
@@ -49,42 +47,49 @@ class OI():
         return self.driver.getRawButton(rawButtonId)
 
     def setupDriverCommands(self):
+        # Imported here as drivehuman imports oi (and subsystems.drive imports drivehuman)
+        from commands.drive.drivehuman import DriveHuman
         flipButton = self.createDriverButton(5)
         flipButton.whenPressed(DriveHuman.createFlipFrontCommand())
 
     def getSelectedAuton(self) -> Command:
-        return self.autonChooser.getSelected()
+        """ Returns the auton command selected on the dashboard (built on first selection). """
+        return self.autonChooser.getSelected().get()
 
     def setupDashboardCommands(self):
         # Set up auton chooser
         self.autonChooser = SendableChooser()
-        self.autonChooser.setDefaultOption("Do Nothing", wpilib.command.WaitCommand(3.0, "Do Nothing"))
-        self.autonChooser.addOption("Drive Forward", DriveTickTimed(1.0, 1.0))
-        self.autonChooser.addOption("Drive Backward", DriveTickTimed(-1.0, -1.0))
-        self.autonChooser.addOption("Rotate Right", DriveTickTimed(1.0, -1.0))
-        self.autonChooser.addOption("Rotate Left", DriveTickTimed(-1.0, 1.0))
+        self.autonChooser.setDefaultOption("Do Nothing", LazyCommand("Do Nothing", "wpilib.command", "WaitCommand", 3.0, "Do Nothing"))
+        self.autonChooser.addOption("Drive Forward", LazyCommand("Drive Forward", "commands.drive.driveticktimed", "DriveTickTimed", 1.0, 1.0))
+        self.autonChooser.addOption("Drive Backward", LazyCommand("Drive Backward", "commands.drive.driveticktimed", "DriveTickTimed", -1.0, -1.0))
+        self.autonChooser.addOption("Rotate Right", LazyCommand("Rotate Right", "commands.drive.driveticktimed", "DriveTickTimed", 1.0, -1.0))
+        self.autonChooser.addOption("Rotate Left", LazyCommand("Rotate Left", "commands.drive.driveticktimed", "DriveTickTimed", -1.0, 1.0))
         SmartDashboard.putData("Auto mode", self.autonChooser)
+        # Auton settings need to be adjustable before an auton is ever built
+        DriveTickTimed.setupDashboardControls()
 
         # Drive controls
+        from commands.drive.drivehuman import DriveHuman
         DriveHuman.setupDashboardControls()
         SmartDashboard.putData("Brake Control", DriveHuman.createBrakeModeToggleCommand())
         SmartDashboard.putData("Flip Front", DriveHuman.createFlipFrontCommand())
 
         # Set up utility controls
-        SmartDashboard.putData("Measure", Measure())
+        SmartDashboard.putData("Measure", LazyCommand("Measure", "commands.drive.measure", "Measure"))
 
         # Climber settings
-        SmartDashboard.putData("Full Auto Climb", ClimbUp())        
+        SmartDashboard.putData("Full Auto Climb", LazyCommand("ClimbUp", "commands.lift", "ClimbUp"))
         if self.debug:
-          SmartDashboard.putData("Extend Both Legs", ExtendBothLegs())
-          SmartDashboard.putData("Drive to Front Sensor", DriveToFrontSensor())
-          SmartDashboard.putData("Retract Front Legs", RetractFrontLegs())
-          SmartDashboard.putData("Drive to Back Sensor", DriveToBackSensor())
-          SmartDashboard.putData("Retract Back Legs", RetractBackLegs())
+          SmartDashboard.putData("Extend Both Legs", LazyCommand("ExtendBothLegs", "commands.lift", "ExtendBothLegs"))
+          SmartDashboard.putData("Drive to Front Sensor", LazyCommand("DriveToFrontSensor", "commands.lift", "DriveToFrontSensor"))
+          SmartDashboard.putData("Retract Front Legs", LazyCommand("RetractFrontLegs", "commands.lift", "RetractFrontLegs"))
+          SmartDashboard.putData("Drive to Back Sensor", LazyCommand("DriveToBackSensor", "commands.lift", "DriveToBackSensor"))
+          SmartDashboard.putData("Retract Back Legs", LazyCommand("RetractBackLegs", "commands.lift", "RetractBackLegs"))
 
         # Debug tools (if enabled)
         if self.debug:
-            SmartDashboard.putData("CPU Load Test", LoadTest())
+            self.loadTest = LazyCommand("LoadTest", "commands.loadtest", "LoadTest")
+            SmartDashboard.putData("CPU Load Test", self.loadTest)
             SmartDashboard.putData("Drive Subsystem", subsystems.drive)
             dd = subsystems.drive.getDifferentialDrive()
             if dd != None:
@@ -0,0 +1,64 @@
+import multiprocessing
+import threading
+import time
+
+# Length of one busy/idle cycle of the background load (seconds)
+kCycleSecs: float = 0.01
+
+# Iterations of kernel to run between checks of the clock
+kChunk: int = 64
+
+# Kinds of background load
+kNone: str = "none"
+kThread: str = "thread"
+kProcess: str = "process"
+
+def runLoad(run, duty: float, stopEvent):
+    """
+    Runs a kernel for duty percent of each cycle until asked to stop.
+
+    : param run : Kernel function taking an iteration count (must be picklable for processes).
+    : param duty : Fraction of each cycle [0, 1] to keep the CPU busy.
+    : param stopEvent : threading.Event or multiprocessing.Event used to stop the load.
+    """
+    busySecs: float = kCycleSecs * duty
+    idleSecs: float = kCycleSecs - busySecs
+    while not stopEvent.is_set():
+        busyEnd: float = time.perf_counter() + busySecs
+        while time.perf_counter() < busyEnd:
+            run(kChunk)
+        if idleSecs > 0:
+            stopEvent.wait(idleSecs)
+
+
+class BackgroundLoad():
+    """ Runs a kernel on a background thread (shares the GIL) or a separate process. """
+    def __init__(self, run, kind: str = kThread, duty: float = 1.0):
+        """
+        : param run : Kernel function taking an iteration count.
+        : param kind : kNone, kThread or kProcess.
+        : param duty : Fraction of each cycle [0, 1] to keep the CPU busy.
+        """
+        self.run = run
+        self.kind: str = kind
+        self.duty: float = duty
+        self.worker = None
+        self.stopEvent = None
+
+    def start(self):
+        if self.worker != None or self.kind == kNone:
+            return
+        if self.kind == kProcess:
+            self.stopEvent = multiprocessing.Event()
+            self.worker = multiprocessing.Process(target=runLoad, args=(self.run, self.duty, self.stopEvent), daemon=True)
+        else:
+            self.stopEvent = threading.Event()
+            self.worker = threading.Thread(target=runLoad, args=(self.run, self.duty, self.stopEvent), daemon=True)
+        self.worker.start()
+
+    def stop(self):
+        if self.worker == None:
+            return
+        self.stopEvent.set()
+        self.worker.join()
+        self.worker = None
@@ -0,0 +1,58 @@
+"""
+Command line runner for the LoadTest benchmark kernels (no robot loop required).
+
+Run from the robot directory on a development machine or the roboRIO:
+
+    python3 -m perf.bench --trials 10 --json results.json
+"""
+import argparse
+import sys
+from perf.benchmark import BenchmarkSuite
+from perf.kernels import createKernels, getKernelNames
+
+def formatTable(suite: BenchmarkSuite) -> list:
+    """ Returns formatted rows of results (header first). """
+    rows = [ "%-16s %10s %6s %12s %12s %8s" % ("Kernel", "Iters", "Trials", "ns/op", "+/- ns (95%)", "+/- %") ]
+    for r in suite.results:
+        ci: float = r.getConfidence()
+        mean: float = r.getMean()
+        pct: float = 100.0 * ci / mean if mean > 0 else 0
+        rows.append("%-16s %10d %6d %12.1f %12.1f %8.2f" % (r.name, r.iterations, len(r.times), r.getNsPerOp(), ci * 1e9 / r.iterations, pct))
+    return rows
+
+def main(args = None) -> int:
+    parser = argparse.ArgumentParser(description="Runs LoadTest benchmark kernels outside of the robot loop.")
+    parser.add_argument("--kernels", nargs="*", help="Names of kernels to run (default all)")
+    parser.add_argument("--trials", type=int, default=10, help="Timed trials per kernel")
+    parser.add_argument("--warmups", type=int, default=2, help="Untimed warm up trials per kernel")
+    parser.add_argument("--target", type=float, default=0.1, help="Target seconds per trial")
+    parser.add_argument("--json", help="File to write JSON results to")
+    parser.add_argument("--list", action="store_true", help="List kernel names and exit")
+    opts = parser.parse_args(args)
+
+    names: list = getKernelNames()
+    if opts.list:
+        for name in names:
+            print(name)
+        return 0
+    if opts.kernels:
+        unknown = set(opts.kernels) - set(names)
+        if unknown:
+            parser.error("Unknown kernel(s): " + ", ".join(sorted(unknown)))
+        names = opts.kernels
+    # Only create the selected kernels (some import robot code when created)
+    kernels = createKernels(names)
+
+    suite: BenchmarkSuite = BenchmarkSuite(kernels, opts.trials, opts.warmups, opts.target)
+    suite.run()
+    print("\n".join(formatTable(suite)))
+    for r in suite.results:
+        if r.speedup > 0:
+            print("%s is %.1fx faster than %s" % (r.name, r.speedup, r.baseline))
+    if opts.json:
+        suite.write(opts.json)
+        print("Wrote results to " + opts.json)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
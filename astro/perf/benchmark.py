@@ -0,0 +1,218 @@
+import json
+import math
+import platform
+import sys
+import time
+
+# Two sided 95% critical values of Student's t distribution for 1 to 30 degrees of freedom
+kT95 = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+        2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+        2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042)
+
+def t95(df: int) -> float:
+    """ Returns two sided 95% critical t value for degrees of freedom specified. """
+    if df < 1:
+        return 0
+    if df <= len(kT95):
+        return kT95[df - 1]
+    return 1.960
+
+class Kernel():
+    """ A named piece of work to benchmark. """
+    def __init__(self, name: str, run, baseline: str = None):
+        """
+        : param name : Name to report results under.
+        : param run : Function taking an iteration count that performs the work that many times.
+        : param baseline : Name of kernel doing the same work another way (to report speedup against).
+        """
+        self.name: str = name
+        self.run = run
+        self.baseline: str = baseline
+
+
+class Result():
+    """ Timing results from repeated trials of a Kernel. """
+    def __init__(self, name: str, iterations: int, baseline: str = None):
+        self.name: str = name
+        self.iterations: int = iterations
+        self.baseline: str = baseline
+        # Baseline ns per op divided by our ns per op (filled in by BenchmarkSuite)
+        self.speedup: float = 0
+        # Seconds taken by each trial
+        self.times: list = []
+
+    def getMean(self) -> float:
+        """ Returns mean seconds per trial. """
+        if len(self.times) == 0:
+            return 0
+        return sum(self.times) / len(self.times)
+
+    def getStdDev(self) -> float:
+        """ Returns sample standard deviation of seconds per trial. """
+        n: int = len(self.times)
+        if n < 2:
+            return 0
+        avg: float = self.getMean()
+        return math.sqrt(sum((t - avg) ** 2 for t in self.times) / (n - 1))
+
+    def getConfidence(self) -> float:
+        """ Returns half width (seconds) of the 95% confidence interval of the mean trial time. """
+        n: int = len(self.times)
+        if n < 2:
+            return 0
+        return t95(n - 1) * self.getStdDev() / math.sqrt(n)
+
+    def getOpsPerSec(self) -> float:
+        """ Returns iterations per second (based on mean trial time). """
+        mean: float = self.getMean()
+        if mean <= 0:
+            return 0
+        return self.iterations / mean
+
+    def getNsPerOp(self) -> float:
+        """ Returns nanoseconds per iteration (based on mean trial time). """
+        if self.iterations == 0:
+            return 0
+        return self.getMean() * 1e9 / self.iterations
+
+    def toDict(self) -> dict:
+        return {
+            "name": self.name,
+            "iterations": self.iterations,
+            "trials": len(self.times),
+            "mean_secs": self.getMean(),
+            "stddev_secs": self.getStdDev(),
+            "ci95_secs": self.getConfidence(),
+            "ops_per_sec": self.getOpsPerSec(),
+            "ns_per_op": self.getNsPerOp(),
+            "baseline": self.baseline,
+            "speedup": self.speedup,
+            "times": self.times
+        }
+
+
+def timeKernel(kernel: Kernel, iterations: int) -> float:
+    """ Returns seconds taken to run kernel for the number of iterations specified. """
+    t0: float = time.perf_counter()
+    kernel.run(iterations)
+    return time.perf_counter() - t0
+
+
+def calibrateSteps(kernel: Kernel, targetSecs: float, tolerance: float = 0.2, passes: int = 3):
+    """
+    Generator version of calibrate() that yields after the doubling passes and
+    after each re-timing pass (so no step takes much longer than one trial).
+    The iteration count is the generator's return value (use "yield from"),
+    see calibrate() for the parameters.
+    """
+    iterations: int = 1
+    secs: float = timeKernel(kernel, iterations)
+    while secs < targetSecs / 10:
+        iterations *= 2
+        secs = timeKernel(kernel, iterations)
+    yield
+    for _ in range(passes):
+        iterations = max(1, int(iterations * targetSecs / max(secs, 1e-9)))
+        secs = timeKernel(kernel, iterations)
+        if abs(secs - targetSecs) <= tolerance * targetSecs:
+            break
+        yield
+    return iterations
+
+def calibrate(kernel: Kernel, targetSecs: float, tolerance: float = 0.2, passes: int = 3) -> int:
+    """
+    Determines how many iterations of a kernel take roughly the target time.
+
+    Doubles the iterations until a run takes at least a tenth of the target
+    (so timer resolution does not matter) then scales linearly to the target.
+    The estimate is re-timed and re-scaled until it lands within the tolerance
+    (caches warming up and first call costs make the first estimate optimistic).
+
+    : param kernel : Kernel to calibrate.
+    : param targetSecs : How long we want a trial to take.
+    : param tolerance : Acceptable relative error from target time.
+    : param passes : Maximum number of times to re-time and re-scale.
+    : return : Number of iterations to use per trial (at least 1).
+    """
+    steps = calibrateSteps(kernel, targetSecs, tolerance, passes)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
+
+
+class BenchmarkSuite():
+    """
+    Runs a set of kernels (calibrate, warm up, then repeated trials) and collects Results.
+
+    Use steps() to run the suite a piece at a time (each step is at most one
+    trial) so it can be spread across execute() calls of a command, or run()
+    to do everything at once.
+    """
+    def __init__(self, kernels, trials: int = 5, warmups: int = 1, targetSecs: float = 0.05):
+        """
+        : param kernels : Kernels to run (in order).
+        : param trials : Number of timed trials for each kernel.
+        : param warmups : Number of untimed trials to run first.
+        : param targetSecs : Desired length of each trial.
+        """
+        self.kernels = list(kernels)
+        self.trials: int = trials
+        self.warmups: int = warmups
+        self.targetSecs: float = targetSecs
+        self.results: list = []
+
+    def steps(self):
+        """ Generator that runs the suite yielding after each calibration/warm up/trial. """
+        self.results = []
+        for kernel in self.kernels:
+            iterations: int = yield from calibrateSteps(kernel, self.targetSecs)
+            yield
+            for _ in range(self.warmups):
+                kernel.run(iterations)
+                yield
+            result: Result = Result(kernel.name, iterations, kernel.baseline)
+            self.results.append(result)
+            for _ in range(self.trials):
+                result.times.append(timeKernel(kernel, iterations))
+                yield
+        self.computeSpeedups()
+
+    def computeSpeedups(self):
+        """ Fills in speedup of each result that has a baseline result. """
+        for r in self.results:
+            base: Result = self.getResult(r.baseline) if r.baseline != None else None
+            if base != None and r.getNsPerOp() > 0:
+                r.speedup = base.getNsPerOp() / r.getNsPerOp()
+
+    def run(self) -> list:
+        """ Runs the entire suite and returns the list of Results. """
+        for _ in self.steps():
+            pass
+        return self.results
+
+    def getResult(self, name: str) -> Result:
+        """ Returns result for the named kernel (None if not run). """
+        for r in self.results:
+            if r.name == name:
+                return r
+        return None
+
+    def toDict(self) -> dict:
+        return {
+            "python": sys.version,
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "timestamp": time.time(),
+            "trials": self.trials,
+            "warmups": self.warmups,
+            "target_secs": self.targetSecs,
+            "kernels": [r.toDict() for r in self.results]
+        }
+
+    def write(self, path: str):
+        """ Writes results as JSON to the file specified. """
+        with open(path, "w") as f:
+            json.dump(self.toDict(), f, indent=2)
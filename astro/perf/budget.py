@@ -0,0 +1,51 @@
+import time
+
+# Work priorities (lower value is more important)
+kControl: int = 0       # Motor outputs, never deferred
+kSensors: int = 1       # Sensor reads feeding control
+kTelemetry: int = 2     # Dashboard values
+kDiagnostics: int = 3   # Performance/debug publishing
+
+class LoopBudget():
+    """
+    Tracks time spent in the current loop iteration and sheds low priority work
+    once a priority's threshold is passed.
+
+    Code asks allow(priority) before doing optional work (like dashboard
+    writes). Periodic work that should be deferred to the next iteration
+    (instead of dropped) when denied is registered with perf.rategroups, which
+    checks allow() for each task.
+    """
+    def __init__(self):
+        self.start: float = time.perf_counter()
+        # Milliseconds into an iteration after which work of each priority is deferred
+        self.thresholds = { kControl: None, kSensors: None, kTelemetry: 10.0, kDiagnostics: 8.0 }
+        # Number of allow() requests denied for each priority
+        self.denied = { kControl: 0, kSensors: 0, kTelemetry: 0, kDiagnostics: 0 }
+
+    def setThreshold(self, priority: int, millis: float):
+        """
+        : param priority : Priority to set threshold for.
+        : param millis : Elapsed milliseconds after which work is deferred (None to never defer).
+        """
+        self.thresholds[priority] = millis
+
+    def begin(self):
+        """ Call at the start of each loop iteration. """
+        self.start = time.perf_counter()
+
+    def getElapsed(self) -> float:
+        """ Returns milliseconds spent so far in the current iteration. """
+        return (time.perf_counter() - self.start) * 1000.0
+
+    def allow(self, priority: int) -> bool:
+        """ Returns True if there is still time in this iteration for work of the priority specified. """
+        limit = self.thresholds[priority]
+        if limit == None or self.getElapsed() < limit:
+            return True
+        self.denied[priority] += 1
+        return False
+
+
+""" Single instance shared by robot loop, commands and subsystems """
+instance: LoopBudget = LoopBudget()
@@ -0,0 +1,16 @@
+import os
+import wpilib
+
+# Directory on the roboRIO where we are allowed to write files
+kRobotDir: str = "/home/lvuser"
+
+def getOutputPath(name: str) -> str:
+  """
+  Returns full path to use when writing a diagnostic output file.
+
+  : param name : Base name of file (like "profile.folded").
+  : return : Path in home directory on roboRIO or current directory in simulation.
+  """
+  if wpilib.RobotBase.isSimulation():
+    return os.path.abspath(name)
+  return os.path.join(kRobotDir, name)
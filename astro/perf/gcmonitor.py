@@ -0,0 +1,98 @@
+import gc
+import time
+from math5511.stats import Stats
+import telemetry
+
+# Robot modes we keep separate statistics for
+kModes = ("Init", "Disabled", "Autonomous", "Teleop", "Test")
+
+# Generation 2 threshold used to effectively disable automatic full collections
+kHoldThreshold: int = 1 << 30
+
+class GcMonitor():
+    """
+    Times every garbage collection (through gc.callbacks) and manages when full collections run.
+
+    Pause times are tracked separately for each robot mode. Optionally,
+    automatic generation 2 (full) collections can be held off while the
+    robot is enabled and then run explicitly once the robot is disabled.
+    """
+    def __init__(self, holdGen2: bool = False):
+        """
+        : param holdGen2 : Pass True to hold off automatic full collections while enabled.
+        """
+        self.holdGen2: bool = holdGen2
+        self.mode: str = kModes[0]
+        self.stats = {}
+        self.gen2 = {}
+        # Dashboard entries (count, full count, total ms, max ms) for each mode
+        self.entries = {}
+        for mode in kModes:
+            self.stats[mode] = Stats()
+            self.gen2[mode] = 0
+            prefix: str = "GC " + mode
+            self.entries[mode] = (telemetry.getEntry(prefix + " Count"), telemetry.getEntry(prefix + " Full"),
+                telemetry.getEntry(prefix + " Total ms"), telemetry.getEntry(prefix + " Max ms"))
+        self.thresholds = gc.get_threshold()
+        self.started: float = 0
+        self.installed: bool = False
+
+    def install(self):
+        """ Registers our callback with the garbage collector. """
+        if not self.installed:
+            gc.callbacks.append(self.__callback__)
+            self.installed = True
+
+    def uninstall(self):
+        if self.installed:
+            gc.callbacks.remove(self.__callback__)
+            self.installed = False
+
+    def __callback__(self, phase: str, info: dict):
+        if phase == "start":
+            self.started = time.perf_counter()
+        else:
+            self.stats[self.mode].add((time.perf_counter() - self.started) * 1000.0)
+            if info["generation"] == 2:
+                self.gen2[self.mode] += 1
+
+    def freeze(self):
+        """
+        Collects then moves all current objects (subsystems, commands, etc) to the
+        permanent generation so future collections do not rescan them. Call once
+        at the end of robotInit.
+        """
+        gc.collect()
+        if hasattr(gc, "freeze"):
+            gc.freeze()
+
+    def setMode(self, mode: str):
+        """
+        Call at each mode transition (disabledInit, autonomousInit, etc).
+        : param mode : Name of new robot mode (one of kModes).
+        """
+        self.publish()
+        self.mode = mode
+        if not self.holdGen2:
+            return
+        if mode == "Disabled":
+            # Safe time for a full collection, then allow them again
+            gc.set_threshold(*self.thresholds)
+            gc.collect(2)
+        else:
+            t0, t1, _ = self.thresholds
+            gc.set_threshold(t0, t1, kHoldThreshold)
+
+    def getStats(self, mode: str) -> Stats:
+        """ Returns statistics of pause times (milliseconds) for a mode. """
+        return self.stats[mode]
+
+    def publish(self):
+        """ Publishes pause counts and durations for each mode. """
+        for mode in kModes:
+            s: Stats = self.stats[mode]
+            countEntry, fullEntry, totalEntry, maxEntry = self.entries[mode]
+            countEntry.setNumber(s.getCount())
+            fullEntry.setNumber(self.gen2[mode])
+            totalEntry.setNumber(s.getSum())
+            maxEntry.setNumber(s.getMax())
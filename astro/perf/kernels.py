@@ -0,0 +1,179 @@
+import math
+import sys
+from types import SimpleNamespace
+from math5511.stats import Stats
+from perf.benchmark import Kernel
+
+# NumPy is optional (vectorized kernels are skipped if it is not installed)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def synthetic(n: int) -> float:
+    """
+    LoadTest's original mix of work: Stats.add() plus trig/pow math.
+
+    The original version ran an inner Stats.add() loop whose length grew with
+    the iteration count (quadratic work), so it had no fixed cost per
+    iteration. This version does a fixed amount of work per iteration, so
+    "CPU Test Hz" is not comparable with results from before the benchmark
+    suite.
+    """
+    stats: Stats = Stats()
+    accum: float = 0.0
+    for i in range(n):
+        x = int((int(i >> 3) + 1) * 7 / 8)
+        if i % 4:
+            x = -x
+        stats.add(x)
+        ratio = float(i & 1023) / 1024
+        accum += math.sin(ratio)
+        accum += math.pow(math.pi, ratio)
+        accum += math.cos(ratio)
+        stats.add(accum)
+    return accum
+
+def syntheticNumPy(n: int) -> float:
+    """ Same work as synthetic() computed with NumPy arrays and Stats.addMany(). """
+    stats: Stats = Stats()
+    i = np.arange(n)
+    x = ((i >> 3) + 1) * 7 // 8
+    x = np.where(i % 4 != 0, -x, x)
+    ratio = (i & 1023) / 1024.0
+    accum = np.cumsum(np.sin(ratio) + np.power(math.pi, ratio) + np.cos(ratio))
+    stats.addMany(x)
+    stats.addMany(accum)
+    return float(accum[-1]) if n > 0 else 0.0
+
+def floatMath(n: int) -> float:
+    """ Typical control loop math (gains, clamps, sqrt, atan2). """
+    accum: float = 0.0
+    for i in range(n):
+        x: float = (i & 255) / 256.0
+        y: float = 1.0 - x
+        power: float = min(max(0.7 * x - 0.3 * y, -1.0), 1.0)
+        accum += math.sqrt(x * x + y * y) + math.atan2(y, x) + power * abs(power)
+    return accum
+
+def floatMathNumPy(n: int) -> float:
+    """ Same work as floatMath() computed with NumPy arrays. """
+    x = (np.arange(n) & 255) / 256.0
+    y = 1.0 - x
+    power = np.clip(0.7 * x - 0.3 * y, -1.0, 1.0)
+    return float(np.sum(np.sqrt(x * x + y * y) + np.arctan2(y, x) + power * np.abs(power)))
+
+def dictLookups(n: int) -> float:
+    """ String keyed dictionary lookups (like preferences/dashboard tables). """
+    table = {"Fixed Left": 0.4, "Fixed Right": 0.4, "Rotation Gain": 0.5, "Slow Gain": 0.5}
+    keys = tuple(table.keys())
+    accum: float = 0.0
+    for i in range(n):
+        accum += table[keys[i & 3]]
+    return accum
+
+def createDashboardPuts():
+    """ Creates kernel making SmartDashboard.putNumber() calls (NetworkTables writes). """
+    from wpilib.smartdashboard import SmartDashboard
+
+    def dashboardPuts(n: int) -> float:
+        for i in range(n):
+            SmartDashboard.putNumber("Bench Value", i)
+        return n
+
+    return dashboardPuts
+
+class StandInChannel():
+    """ Same lookups as subsystems.sensors.Channel.get() once the reading has been taken this cycle. """
+    def __init__(self, sensors):
+        self.sensors = sensors
+        self.cycle: int = 0
+        self.value: float = 0.0
+        self.requests: int = 0
+
+    def get(self) -> float:
+        self.requests += 1
+        sensors = self.sensors
+        if self.cycle != sensors.cycle:
+            self.cycle = sensors.cycle
+        return self.value
+
+
+class StandInTread():
+    """ Same call chain as subsystems.drive.Tread.getVelocity(). """
+    def __init__(self, sensors):
+        self.velChannel: StandInChannel = StandInChannel(sensors)
+
+    def getVelocity(self) -> float:
+        return self.velChannel.get()
+
+
+class StandInDrive():
+    """ Same call chain as subsystems.drive.Drive.getAvgVelocity() (used when the robot's Drive is not running). """
+    def __init__(self):
+        self.sensors = SimpleNamespace(cycle=0)
+        self.left: StandInTread = StandInTread(self.sensors)
+        self.right: StandInTread = StandInTread(self.sensors)
+
+    def getAvgVelocity(self) -> float:
+        return (self.left.getVelocity() + self.right.getVelocity()) / 2
+
+
+def createDrive():
+    """ Returns the robot's Drive subsystem if it has been created, otherwise a StandInDrive. """
+    # Not imported here, importing subsystems pulls in ctre, navx and the drive commands
+    subsystems = sys.modules.get("subsystems")
+    if subsystems != None and subsystems.drive != None:
+        return subsystems.drive
+    return StandInDrive()
+
+def createMethodCalls():
+    """ Creates kernel making attribute heavy method calls (Drive.getAvgVelocity()). """
+    drive = createDrive()
+
+    def methodCalls(n: int) -> float:
+        accum: float = 0.0
+        for _ in range(n):
+            accum += drive.getAvgVelocity()
+        return accum
+
+    return methodCalls
+
+def createIndexTable():
+    """ Creates kernel doing DriveHuman.fromIndexTable() lookups. """
+    from commands.drive.drivehuman import DriveHuman, kThrottlesIndexed
+    human = SimpleNamespace(minDeflect=1.0 / 32.0)
+    fromIndexTable = DriveHuman.fromIndexTable
+
+    def indexTable(n: int) -> float:
+        accum: float = 0.0
+        for i in range(n):
+            accum += fromIndexTable(human, (i & 255) / 128.0 - 1.0, kThrottlesIndexed)
+        return accum
+
+    return indexTable
+
+# Standard kernels reflecting typical robot work: (name, function that creates the kernel's run function, baseline name).
+# Only kernels that are selected get created, so robot imports (wpilib, subsystems) happen only when needed.
+kKernels = [
+    ("synthetic", lambda: synthetic, None),
+    ("method_calls", createMethodCalls, None),
+    ("index_table", createIndexTable, None),
+    ("dashboard_puts", createDashboardPuts, None),
+    ("float_math", lambda: floatMath, None),
+    ("dict_lookups", lambda: dictLookups, None)
+]
+if np != None:
+    kKernels.append(("synthetic_numpy", lambda: syntheticNumPy, "synthetic"))
+    kKernels.append(("float_math_numpy", lambda: floatMathNumPy, "float_math"))
+
+def getKernelNames() -> list:
+    """ Returns the names of the standard kernels (without creating any of them). """
+    return [ name for name, _, _ in kKernels ]
+
+def createKernels(names = None) -> list:
+    """
+    Returns the standard set of kernels reflecting typical robot work.
+    : param names : Names of kernels to create (default all, see getKernelNames()).
+    """
+    return [ Kernel(name, create(), baseline) for name, create, baseline in kKernels if names == None or name in names ]
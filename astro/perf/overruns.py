@@ -0,0 +1,114 @@
+import heapq
+import itertools
+from wpilib import Timer
+from wpilib.command import Command
+from wpilib.command import CommandGroup
+
+class Overrun():
+    """ Information recorded about a single loop iteration that ran too long. """
+
+    __slots__ = ("millis", "timestamp", "mode", "commands", "phases")
+
+    def __init__(self, millis: float, timestamp: float, mode: str, commands: tuple, phases: tuple):
+        """
+        : param millis : How long the loop iteration took (milliseconds).
+        : param timestamp : FPGA time stamp (seconds) when recorded.
+        : param mode : Robot mode ("Disabled", "Autonomous", "Teleop" or "Test").
+        : param commands : Names of commands that were running.
+        : param phases : Pairs of (phase name, milliseconds) for the iteration.
+        """
+        self.millis = millis
+        self.timestamp = timestamp
+        self.mode = mode
+        self.commands = commands
+        self.phases = phases
+
+    def format(self) -> str:
+        phases = " ".join("%s %.2f" % p for p in self.phases)
+        return "%.2f ms @ %.3f %s [%s] %s" % (self.millis, self.timestamp, self.mode, ", ".join(self.commands), phases)
+
+
+def getCommandName(c: Command) -> str:
+    """ Returns name of command (including the active child if it is a CommandGroup). """
+    name: str = c.getName()
+    if isinstance(c, CommandGroup):
+        # Peek at which stage of the group is running (like ClimbUp stages)
+        idx = getattr(c, "currentCommandIndex", None)
+        entries = getattr(c, "commands", ())
+        if idx != None and 0 <= idx < len(entries):
+            name += ":" + entries[idx].command.getName()
+    return name
+
+
+class OverrunLog():
+    """
+    Keeps the worst N loop iterations that exceeded the loop period.
+
+    Nothing is allocated unless an iteration is over the threshold AND worse
+    than the best entry already kept, so checking each loop is cheap.
+    """
+    def __init__(self, getMode, subsystems, watched = (), phases = None, maxEntries: int = 10, thresholdMs: float = 20.0):
+        """
+        : param getMode : Function returning name of current robot mode.
+        : param subsystems : Subsystems whose current command should be recorded.
+        : param watched : Additional commands to record if running (like LoadTest).
+        : param phases : Optional PhaseTimer to record per-phase timings from.
+        : param maxEntries : Number of worst iterations to keep.
+        : param thresholdMs : Iterations longer than this are considered overruns.
+        """
+        self.getMode = getMode
+        self.subsystems = tuple(subsystems)
+        self.watched = tuple(watched)
+        self.phases = phases
+        self.maxEntries: int = maxEntries
+        self.thresholdMs: float = thresholdMs
+        # Min-heap of (millis, seq, Overrun) so the best of the worst is at the top
+        self.heap: list = []
+        self.seq = itertools.count()
+        # Total number of overruns seen (including ones not kept)
+        self.count: int = 0
+
+    def zero(self):
+        self.heap.clear()
+        self.count = 0
+
+    def check(self, millis: float) -> bool:
+        """
+        Records the iteration if it is an overrun and one of the worst seen.
+
+        : param millis : How long the loop iteration took (milliseconds).
+        : return : True if iteration was added to the log.
+        """
+        if millis <= self.thresholdMs:
+            return False
+        self.count += 1
+        if len(self.heap) >= self.maxEntries and millis <= self.heap[0][0]:
+            return False
+
+        commands = []
+        for s in self.subsystems:
+            c: Command = s.getCurrentCommand()
+            if c != None:
+                commands.append(getCommandName(c))
+        for c in self.watched:
+            if c.isRunning():
+                commands.append(getCommandName(c))
+        times = ()
+        if self.phases != None:
+            times = tuple((name, self.phases.getLast(name)) for name in self.phases.names)
+
+        entry = Overrun(millis, Timer.getFPGATimestamp(), self.getMode(), tuple(commands), times)
+        item = (millis, next(self.seq), entry)
+        if len(self.heap) >= self.maxEntries:
+            heapq.heapreplace(self.heap, item)
+        else:
+            heapq.heappush(self.heap, item)
+        return True
+
+    def getEntries(self) -> list:
+        """ Returns the kept Overrun entries (worst first). """
+        return [item[2] for item in sorted(self.heap, reverse=True)]
+
+    def getTable(self) -> list:
+        """ Returns a formatted line for each kept entry (worst first). """
+        return [e.format() for e in self.getEntries()]
@@ -0,0 +1,102 @@
+import time
+from math5511.stats import Stats
+
+class PhaseTimer():
+    """
+    Helper class to break down how long each phase of a loop iteration takes.
+
+    Call begin() at the start of each iteration, mark() at the end of each phase
+    and end() once the iteration is done. Time spent in calls wrapped with wrap()
+    is charged to the wrapped phase and NOT to the phase that contains it, so
+    the phases always add up to the total time of the iteration.
+    """
+    def __init__(self, names):
+        """
+        : param names : Names of phases in the order they should be reported.
+        """
+        self.names = tuple(names)
+        self.stats = {}
+        # Time (secs) charged to each phase during current iteration
+        self.current = {}
+        for name in self.names:
+            self.stats[name] = Stats()
+            self.current[name] = 0.0
+        self.total: Stats = Stats()
+        self.start: float = 0
+        self.last: float = 0
+        # Time (secs) recorded by wrapped calls since the last mark
+        self.nested: float = 0
+
+    def zero(self):
+        """ Clears all accumulated statistics. """
+        for name in self.names:
+            self.stats[name].zero()
+        self.total.zero()
+
+    def begin(self):
+        """ Call at the start of each loop iteration. """
+        for name in self.names:
+            self.current[name] = 0.0
+        self.nested = 0
+        self.start = self.last = time.perf_counter()
+
+    def mark(self, name: str):
+        """
+        Charges the time since the prior mark (less any wrapped calls) to a phase.
+        : param name : Name of phase that just completed.
+        """
+        now: float = time.perf_counter()
+        self.current[name] += now - self.last - self.nested
+        self.nested = 0
+        self.last = now
+
+    def charge(self, name: str, secs: float):
+        """
+        Charges time measured elsewhere (nested within the current phase) to a phase.
+        : param name : Name of phase to charge time to.
+        : param secs : Seconds to charge.
+        """
+        self.current[name] += secs
+        self.nested += secs
+
+    def end(self):
+        """ Call at the end of each loop iteration to record the phase times. """
+        for name in self.names:
+            self.stats[name].add(self.current[name] * 1000.0)
+        self.total.add((self.last - self.start) * 1000.0)
+
+    def getLast(self, name: str) -> float:
+        """ Returns milliseconds charged to phase in the current (or most recent) iteration. """
+        return self.current[name] * 1000.0
+
+    def getStats(self, name: str) -> Stats:
+        """ Returns statistics (in milliseconds) for a phase. """
+        return self.stats[name]
+
+    def wrap(self, obj, method: str, name: str):
+        """
+        Replaces a method on an object instance with one that charges its run time to a phase.
+
+        : param obj : Object (like a Subsystem) to instrument.
+        : param method : Name of method to wrap (like "periodic").
+        : param name : Name of phase to charge time to.
+        """
+        func = getattr(obj, method)
+        timer = self
+
+        def timed(*args, **kwargs):
+            t0: float = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timer.charge(name, time.perf_counter() - t0)
+
+        setattr(obj, method, timed)
+
+    def getSummary(self) -> str:
+        """ Returns compact "name avg/max" breakdown (milliseconds) of all phases. """
+        parts = []
+        for name in self.names:
+            s: Stats = self.stats[name]
+            parts.append("%s %.2f/%.2f" % (name, s.getAvg(), s.getMax()))
+        return " ".join(parts)
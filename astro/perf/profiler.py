@@ -0,0 +1,106 @@
+import time
+from wpilib.command import Command
+from wpilib.command import Subsystem
+from math5511.stats import Stats
+
+# Methods the scheduler calls on commands and subsystems that we time by default
+kMethods = ("initialize", "execute", "isFinished", "end", "interrupted", "periodic")
+
+# Top level packages holding our own commands and subsystems (others are ignored)
+kPackages = ("commands", "subsystems")
+
+class CommandProfiler():
+    """
+    Tracks call count, total time and worst case time of command and subsystem methods.
+
+    Methods are wrapped at the class level once (so every instance is covered).
+    When the profiler is not enabled the wrappers only check a flag and pass
+    the call through.
+    """
+    def __init__(self):
+        self.enabled: bool = False
+        # Statistics (in milliseconds) keyed by "Class.method"
+        self.stats = {}
+        self.wrapped = set()
+        # Classes instrumentAll() leaves alone
+        self.exclude = ()
+
+    def zero(self):
+        """ Clears all accumulated statistics. """
+        for s in self.stats.values():
+            s.zero()
+
+    def instrumentClass(self, cls, methods = kMethods):
+        """
+        Wraps methods defined directly on a class (inherited methods are wrapped on their own class).
+
+        : param cls : Class (like DriveHuman) to instrument.
+        : param methods : Names of methods to wrap.
+        """
+        for method in methods:
+            func = cls.__dict__.get(method)
+            if func == None or not callable(func):
+                continue
+            key: str = cls.__name__ + "." + method
+            if key in self.wrapped:
+                continue
+            self.wrapped.add(key)
+            setattr(cls, method, self.__createWrapper__(key, func))
+
+    def instrumentAll(self, exclude = None):
+        """
+        Wraps the standard scheduler methods on every Command and Subsystem class
+        defined in our own packages (must be called after they are imported). Safe
+        to call again to pick up classes imported later (already wrapped methods
+        are skipped).
+
+        : param exclude : Classes to leave alone (None to keep those from the prior call).
+        """
+        if exclude != None:
+            self.exclude = tuple(exclude)
+        exclude = self.exclude
+        pending = [ Command, Subsystem ]
+        while pending:
+            cls = pending.pop()
+            pending.extend(cls.__subclasses__())
+            if cls in exclude:
+                continue
+            if cls.__module__.split(".")[0] in kPackages:
+                self.instrumentClass(cls)
+
+    def __createWrapper__(self, key: str, func):
+        stats: Stats = Stats()
+        self.stats[key] = stats
+        profiler = self
+
+        def profiled(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            t0: float = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats.add((time.perf_counter() - t0) * 1000.0)
+
+        profiled.__name__ = func.__name__
+        profiled.__doc__ = func.__doc__
+        return profiled
+
+    def getSorted(self) -> list:
+        """ Returns list of (key, stats) pairs that were called, sorted by total time (largest first). """
+        called = [(k, s) for k, s in self.stats.items() if s.getCount() > 0]
+        called.sort(key=lambda e: e[1].getSum(), reverse=True)
+        return called
+
+    def getTable(self, limit: int = 0) -> list:
+        """
+        Returns formatted rows of the profile table (header first).
+        : param limit : Maximum number of entries to include (0 for all).
+        """
+        rows = [ "%-36s %8s %10s %8s %8s" % ("Method", "Calls", "Total ms", "Avg ms", "Max ms") ]
+        entries = self.getSorted()
+        if limit > 0:
+            entries = entries[:limit]
+        for key, s in entries:
+            rows.append("%-36s %8d %10.2f %8.3f %8.3f" % (key, s.getCount(), s.getSum(), s.getAvg(), s.getMax()))
+        return rows
@@ -0,0 +1,98 @@
+import math
+from perf import budget
+
+# Rate the main robot loop runs at
+kLoopHz: int = 50
+
+class RateTask():
+    """ Work registered with RateGroups. """
+
+    __slots__ = ("name", "func", "divider", "offset", "priority", "pending", "deferCount")
+
+    def __init__(self, name: str, func, divider: int, offset: int, priority: int):
+        self.name: str = name
+        self.func = func
+        # Run every divider ticks when (tick % divider) == offset
+        self.divider: int = divider
+        self.offset: int = offset
+        self.priority: int = priority
+        # Set when its slot came up but the loop budget deferred it
+        self.pending: bool = False
+        # Number of times the loop budget deferred it
+        self.deferCount: int = 0
+
+
+class RateGroups():
+    """
+    Runs periodic work at a declared rate (50 Hz, 10 Hz, 1 Hz, ...) instead of every loop.
+
+    Each task runs every loopHz / hz ticks. When registered, a task is given the
+    phase offset that puts the least work on any one tick, so slow tasks do not
+    all land on the same iteration. Tasks with a deferrable priority honor the
+    loop budget and run on the following tick if their slot is skipped.
+    """
+    def __init__(self, loopHz: int = kLoopHz):
+        """
+        : param loopHz : Rate that run() will be called at.
+        """
+        self.loopHz: int = loopHz
+        self.clear()
+
+    def clear(self):
+        """ Removes all registered tasks (call before constructing subsystems that register work). """
+        self.tasks: list = []
+        # Number of tasks landing on each tick of a cycle long enough for every
+        # divider registered (least common multiple of loopHz and the dividers)
+        self.load: list = [0] * self.loopHz
+        self.ticks: int = 0
+
+    def register(self, name: str, func, hz: float, priority: int = budget.kTelemetry) -> RateTask:
+        """
+        Registers periodic work.
+
+        : param name : Name of work (for reporting).
+        : param func : Function taking no arguments.
+        : param hz : Desired rate (rounded to a divider of the loop rate, may be below 1 Hz).
+        : param priority : Loop budget priority of the work.
+        """
+        if hz <= 0:
+            raise ValueError("Rate for %s must be greater than 0 (got %s)" % (name, hz))
+        divider: int = max(1, int(round(self.loopHz / hz)))
+        period: int = len(self.load)
+        if period % divider != 0:
+            # Repeat the load table so it covers a whole cycle of the new divider
+            self.load = self.load * (divider // math.gcd(period, divider))
+        best: int = 0
+        bestLoad: int = None
+        for offset in range(divider):
+            worst: int = max(self.load[offset::divider])
+            if bestLoad == None or worst < bestLoad:
+                best = offset
+                bestLoad = worst
+        for i in range(best, len(self.load), divider):
+            self.load[i] += 1
+        task: RateTask = RateTask(name, func, divider, best, priority)
+        self.tasks.append(task)
+        return task
+
+    def run(self):
+        """ Call once per loop iteration to run the tasks due this tick. """
+        tick: int = self.ticks
+        self.ticks += 1
+        for task in self.tasks:
+            if not task.pending and (tick % task.divider) != task.offset:
+                continue
+            if budget.instance.allow(task.priority):
+                task.pending = False
+                task.func()
+            else:
+                task.pending = True
+                task.deferCount += 1
+
+    def getDeferTable(self) -> list:
+        """ Returns "count name" lines for tasks the loop budget has deferred. """
+        return [ "%d %s" % (task.deferCount, task.name) for task in self.tasks if task.deferCount > 0 ]
+
+
+""" Single instance run by the robot loop """
+instance: RateGroups = RateGroups()
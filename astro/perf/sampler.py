@@ -0,0 +1,98 @@
+import os
+import sys
+import threading
+
+# Deepest stack we bother to record (keeps each sample bounded)
+kMaxDepth: int = 64
+
+class StackSampler():
+    """
+    Low overhead statistical profiler that periodically samples the stack of one thread.
+
+    A background thread grabs the target thread's current frame with
+    sys._current_frames() at a fixed rate and counts how many times each
+    distinct stack (tuple of code objects) is seen. Stacks are only turned
+    into strings when the results are written out in the "folded" format
+    that flame graph tools (flamegraph.pl, speedscope, etc) accept.
+    """
+    def __init__(self, hz: float = 100.0, threadId: int = None):
+        """
+        : param hz : Number of samples to take per second.
+        : param threadId : Thread to sample (defaults to thread constructing the sampler).
+        """
+        self.hz: float = hz
+        self.threadId: int = threadId if threadId != None else threading.get_ident()
+        self.counts = {}
+        self.samples: int = 0
+        self.thread: threading.Thread = None
+        self.stopEvent: threading.Event = threading.Event()
+
+    def zero(self):
+        self.counts = {}
+        self.samples = 0
+
+    def isRunning(self) -> bool:
+        return self.thread != None
+
+    def start(self):
+        """ Starts the sampling thread (does nothing if already running). """
+        if self.thread != None:
+            return
+        self.stopEvent.clear()
+        self.thread = threading.Thread(target=self.__run__, name="StackSampler", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """ Stops the sampling thread and waits for it to exit. """
+        if self.thread == None:
+            return
+        self.stopEvent.set()
+        self.thread.join()
+        self.thread = None
+
+    def __run__(self):
+        interval: float = 1.0 / self.hz
+        while not self.stopEvent.wait(interval):
+            self.sample()
+
+    def sample(self):
+        """ Records the current stack of the target thread (called by sampling thread). """
+        frame = sys._current_frames().get(self.threadId)
+        if frame == None:
+            return
+        stack = []
+        while frame != None and len(stack) < kMaxDepth:
+            stack.append(frame.f_code)
+            frame = frame.f_back
+        key = tuple(stack)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.samples += 1
+
+    def getFolded(self) -> list:
+        """ Returns lines of collapsed stacks ("root;child;leaf count"), most frequent first. """
+        labels = {}
+        folded = {}
+        for stack, cnt in self.counts.items():
+            names = []
+            for code in reversed(stack):
+                label = labels.get(code)
+                if label == None:
+                    label = os.path.splitext(os.path.basename(code.co_filename))[0] + ":" + code.co_name
+                    labels[code] = label
+                names.append(label)
+            line = ";".join(names)
+            folded[line] = folded.get(line, 0) + cnt
+        return [ "%s %d" % (line, cnt) for line, cnt in sorted(folded.items(), key=lambda e: e[1], reverse=True) ]
+
+    def write(self, path: str) -> int:
+        """
+        Writes collapsed stacks to a file.
+        : param path : File to write to.
+        : return : Number of distinct stacks written.
+        """
+        lines = self.getFolded()
+        with open(path, "w") as f:
+            for line in lines:
+                f.write(line)
+                f.write("\n")
+        return len(lines)
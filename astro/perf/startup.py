@@ -0,0 +1,78 @@
+import builtins
+import sys
+import time
+from contextlib import contextmanager
+
+class StartupTimer():
+    """
+    Records how long the pieces of robot start up take (module imports,
+    subsystem constructors, motor controller configuration calls, OI set up).
+
+    Times are inclusive, so a subsystem's time includes the configuration calls
+    it makes and an import's time includes the modules it imports.
+    """
+    def __init__(self):
+        # Pairs of (name, seconds) in the order recorded
+        self.times: list = []
+        self.created: float = time.perf_counter()
+        self.origImport = None
+        self.importDepth: int = 0
+
+    def record(self, name: str, secs: float):
+        self.times.append((name, secs))
+
+    @contextmanager
+    def section(self, name: str):
+        """ Context manager that records how long the block of code takes (listed before anything recorded inside it). """
+        idx: int = len(self.times)
+        self.times.append((name, 0.0))
+        t0: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.times[idx] = (name, time.perf_counter() - t0)
+
+    def trackImports(self):
+        """ Starts timing the first import of each module (call before the imports to measure). """
+        if self.origImport != None:
+            return
+        self.origImport = builtins.__import__
+        orig = self.origImport
+        timer = self
+
+        def timedImport(name, globals=None, locals=None, fromlist=(), level=0):
+            if level != 0 or name in sys.modules:
+                return orig(name, globals, locals, fromlist, level)
+            label: str = "  " * timer.importDepth + "import " + name
+            idx: int = len(timer.times)
+            timer.times.append((label, 0.0))
+            timer.importDepth += 1
+            t0: float = time.perf_counter()
+            try:
+                return orig(name, globals, locals, fromlist, level)
+            finally:
+                timer.importDepth -= 1
+                timer.times[idx] = (label, time.perf_counter() - t0)
+
+        builtins.__import__ = timedImport
+
+    def stopImports(self):
+        """ Stops timing imports. """
+        if self.origImport != None:
+            builtins.__import__ = self.origImport
+            self.origImport = None
+
+    def getElapsed(self) -> float:
+        """ Returns seconds since this timer was created (typically start of robot.py). """
+        return time.perf_counter() - self.created
+
+    def getTable(self, minMillis: float = 0.0) -> list:
+        """
+        Returns formatted "ms name" lines in the order recorded.
+        : param minMillis : Leave out entries shorter than this.
+        """
+        return [ "%8.2f %s" % (secs * 1000.0, name) for name, secs in self.times if secs * 1000.0 >= minMillis ]
+
+
+""" Single instance (created when first imported, so import it first thing in robot.py) """
+instance: StartupTimer = StartupTimer()
@@ -85,6 +85,8 @@ class PhysicsEngine(object):
 
         x,y,angle = self.drivetrain.get_distance(left, right, timeDiff)
         self.controller.distance_drive(x, y, angle)
+        # Let the robot code compare its odometry with where the robot really is
+        simComms.setPose(*self.controller.get_position())
 
         if(simComms.getEncoders()==True):
             self.distance = [0,0]
@@ -1,21 +1,146 @@
+from array import array
+from wpilib import Timer
 from wpilib.command import Command
 from wpilib import SmartDashboard
+import telemetry
+
+class RateMeter():
+    """
+    Measures how often something happens (like a command's execute() or a
+    subsystem's periodic()) using the time stamps of the most recent ticks
+    kept in a small preallocated ring buffer.
+    """
+    def __init__(self, size: int = 128, clock = Timer.getFPGATimestamp):
+        """
+        : param size : Number of time stamps to keep (must cover the window you care about).
+        : param clock : Function returning current time in seconds.
+        """
+        self.size: int = size
+        self.clock = clock
+        self.times: array = array('d', [0.0]) * size
+        # Dashboard entries used by publish() (resolved on first use)
+        self.entries = None
+        self.entriesName: str = None
+        self.zero()
+
+    def zero(self):
+        self.count: int = 0
+        self.start: float = self.clock()
+
+    def tick(self):
+        """ Records that the event happened now. """
+        self.times[self.count % self.size] = self.clock()
+        self.count += 1
+
+    def getLast(self) -> float:
+        """ Returns time stamp of most recent tick (0 if none). """
+        if self.count == 0:
+            return 0
+        return self.times[(self.count - 1) % self.size]
+
+    def getInstantRate(self) -> float:
+        """ Returns rate (Hz) based on time between the last two ticks. """
+        if self.count < 2:
+            return 0
+        dt: float = self.getLast() - self.times[(self.count - 2) % self.size]
+        return 1.0 / dt if dt > 0 else 0
+
+    def getWindowRate(self, secs: float = 1.0) -> float:
+        """
+        Returns rate (Hz) of ticks over the recent window of time.
+        : param secs : Length of window (limited to what fits in the ring buffer).
+        """
+        now: float = self.clock()
+        n: int = min(self.count, self.size)
+        cutoff: float = now - secs
+        ticks: int = 0
+        oldest: float = now
+        for i in range(1, n + 1):
+            t: float = self.times[(self.count - i) % self.size]
+            if t < cutoff:
+                break
+            ticks += 1
+            oldest = t
+        if ticks == n and n == self.size:
+            # Ring buffer does not reach back to the start of the window,
+            # use the intervals between the ticks we do have
+            span: float = self.getLast() - oldest
+            return (ticks - 1) / span if span > 0 else 0
+        return ticks / secs if secs > 0 else 0
+
+    def getTotalRate(self) -> float:
+        """ Returns average rate (Hz) since created or last zeroed. """
+        dt: float = self.clock() - self.start
+        return self.count / dt if dt > 0 else 0
+
+    def publish(self, name: str):
+        """ Publishes instantaneous, 1 second and since start rates under the name given. """
+        if self.entriesName != name:
+            self.entries = (telemetry.getEntry(name + " Hz"), telemetry.getEntry(name + " Hz (1s)"), telemetry.getEntry(name + " Hz (avg)"))
+            self.entriesName = name
+        instant, window, total = self.entries
+        instant.setNumber(self.getInstantRate())
+        window.setNumber(self.getWindowRate())
+        total.setNumber(self.getTotalRate())
+
+    def attach(self, obj, method: str):
+        """
+        Replaces a method on an object instance with one that ticks this meter each call.
+
+        : param obj : Object (like a Subsystem or Command) to measure.
+        : param method : Name of method to wrap (like "periodic" or "execute").
+        : return : This meter.
+        """
+        func = getattr(obj, method)
+        meter = self
+
+        def ticked(*args, **kwargs):
+            meter.tick()
+            return func(*args, **kwargs)
+
+        setattr(obj, method, ticked)
+        return self
+
+
+# Meters attached with attach() that DebugRate publishes (keyed by dashboard name)
+meters = {}
+
+def attach(obj, method: str, name: str) -> RateMeter:
+    """
+    Attaches a new RateMeter to a method of an object and registers it for publishing.
+
+    : param obj : Object (like subsystems.drive) to measure.
+    : param method : Name of method to measure (like "periodic").
+    : param name : Name to publish rates under.
+    : return : The meter attached.
+    """
+    meter: RateMeter = RateMeter().attach(obj, method)
+    meters[name] = meter
+    return meter
+
 
 class DebugRate(Command):
+    """ Publishes rates of all attached meters (and of its own execute()) while running. """
 
     @staticmethod
     def installControl():
         """ Call this method to add button to control whether rate is updated or not. """
         SmartDashboard.putData("Debug Rate", DebugRate())
+
+    def __init__(self):
+        super().__init__("DebugRate")
+        self.meter: RateMeter = RateMeter()
+        self.setRunWhenDisabled(True)
     
     def initialize(self):
         self.curr = 0
         self.print = 10 #change for frequency
+        self.meter.zero()
 
     def execute(self):
+        self.meter.tick()
         self.curr += 1
         if(self.curr%self.print!=0): return
-        time = self.timeSinceInitialized()
-        SmartDashboard.putNumber("Iterations:", self.curr/(time+1e-5))
-        SmartDashboard.putNumber("Time", time)
-        SmartDashboard.putNumber("Rate", self.curr/(time+1e-5))
+        self.meter.publish("Rate")
+        for name, meter in meters.items():
+            meter.publish(name)
@@ -1,3 +1,7 @@
+# Start timing imports before anything else is loaded
+from perf import startup
+startup.instance.trackImports()
+
 import wpilib
 from wpilib.command import Command
 from wpilib.command import Subsystem
@@ -5,26 +9,132 @@ from wpilib.smartdashboard import SmartDashboard
 import commandbased
 import oi
 import subsystems
+import rate
+import telemetry
+import robotmap
+import configurator
+from perf import budget
+from perf import rategroups
 from commands.performance import Performance
+from commands.profile import ProfileCommands
+from commands.memorytrace import MemoryTrace
+from commands.lazy import LazyCommand
+from perf.phases import PhaseTimer
+from perf.profiler import CommandProfiler
+from perf.overruns import OverrunLog
+from perf.gcmonitor import GcMonitor
+
+# Phases of each loop iteration that we track time for (in order)
+kPhases = ("Mode", "Drive", "Climber", "Commands", "Dashboard")
 
 class MyRobot(commandbased.CommandBasedRobot):
 
+    performance: Performance = None
+    phases: PhaseTimer = None
+    profiler: CommandProfiler = None
+    overruns: OverrunLog = None
+    gcMonitor: GcMonitor = None
+    memoryTrace: MemoryTrace = None
+
     def robotInit(self):
         """ Initalizes all subsystems and user controls. """
+        # Set GcHoldGen2 preference to 1 to hold off full garbage collections until disabled
+        self.gcHoldGen2 = robotmap.getConfigInt("GcHoldGen2", 0) != 0
+        # Time garbage collections (installed first so robotInit collections show up under "Init")
+        self.gcMonitor = GcMonitor(self.gcHoldGen2)
+        self.gcMonitor.install()
+
+        # Shed dashboard/diagnostic work once the loop has used this much of its time
+        budget.instance.setThreshold(budget.kTelemetry, robotmap.getConfigFloat("LoopTelemetryMs", 10.0))
+        budget.instance.setThreshold(budget.kDiagnostics, robotmap.getConfigFloat("LoopDiagnosticsMs", 8.0))
+
+        # Flush dashboard values from a background thread (keeps NetworkTables writes out of the loop)
+        telemetry.start()
+
+        # Done with imports (anything imported later is not part of start up)
+        startup.instance.stopImports()
+        startup.instance.record("imports", startup.instance.getElapsed())
+
         # Set up subsystems
-        subsystems.initialize()
+        with startup.instance.section("subsystems.initialize"):
+            subsystems.initialize()
         # Set up user controls
-        oi.initialize()
+        with startup.instance.section("oi.initialize"):
+            oi.initialize()
         self.debug = True
 
+        # Show how often work is shed (registered after subsystems.initialize() clears the rate groups)
+        rategroups.instance.register("Budget Counts", self.publishBudget, 1)
+        # Keep garbage collection counts current between mode changes
+        rategroups.instance.register("GC Stats", self.gcMonitor.publish, 1, budget.kDiagnostics)
+
         if self.debug:
-            self.performance = Performance()
+            # Wrap command/subsystem methods (only timed while "Profile Commands" is running).
+            # NOTE: Must be done before the instance level wrapping of the phase timer below.
+            self.profiler = CommandProfiler()
+            self.profiler.instrumentAll((ProfileCommands,))
+            SmartDashboard.putData("Profile Commands", ProfileCommands(self.profiler))
+
+            # Break loop time down into phases (subsystem periodic calls
+            # are charged to their own phase instead of "Commands")
+            self.phases = PhaseTimer(kPhases)
+            self.phases.wrap(subsystems.drive, "periodic", "Drive")
+            self.phases.wrap(subsystems.climber, "periodic", "Climber")
+            self.performance = Performance(self.phases)
             SmartDashboard.putData("Measure Performance", self.performance)
+            # Benchmark/sampling modules are heavy to import, wait until they are used
+            SmartDashboard.putData("Interference Test", LazyCommand("InterferenceTest", "commands.loadtest", "InterferenceTest", self.performance))
+            SmartDashboard.putData("Sample Profile", LazyCommand("SampleProfile", "commands.sampleprofile", "SampleProfile"))
+            # Check that subsystems really run every loop (published by "Debug Rate")
+            rate.attach(subsystems.drive, "periodic", "Drive")
+            rate.attach(subsystems.climber, "periodic", "Climber")
+            rate.DebugRate.installControl()
+            self.memoryTrace = MemoryTrace()
+            SmartDashboard.putData("Memory Trace", self.memoryTrace)
+
+            # Keep worst loop overruns so we can review them after a match
+            watched = ()
+            if oi.instance.loadTest != None:
+                watched = (oi.instance.loadTest,)
+            self.overruns = OverrunLog(self.getModeName, (subsystems.drive, subsystems.climber), \
+                watched, self.phases, 10, wpilib.TimedRobot.kDefaultPeriod * 1000.0)
+
+        # Everything created so far lives for the entire run, stop rescanning it
+        self.gcMonitor.freeze()
+
+        # Publish how long start up took (boot time after a brownout costs match time)
+        table = startup.instance.getTable(0.5)
+        SmartDashboard.putNumber("Startup Secs", startup.instance.getElapsed())
+        SmartDashboard.putStringArray("Startup Times", table)
+        print("Startup took %.3f secs" % startup.instance.getElapsed())
+        for line in table:
+            print(line)
+        # Motor controllers are configured in parallel, report how much that saved and any failures
+        SmartDashboard.putNumber("Motor Config Secs", configurator.instance.elapsed)
+        SmartDashboard.putStringArray("Motor Config Failures", configurator.instance.failures)
+        print("Motor config took %.3f secs (%.3f secs if serial)" % (configurator.instance.elapsed, configurator.instance.getSerialSecs()))
+        for line in configurator.instance.failures:
+            print("Motor config failed: " + line)
     
+    def modeChanged(self, mode: str):
+        """ Lets diagnostic helpers know we have transitioned to a new mode. """
+        if self.memoryTrace != None:
+            self.memoryTrace.snapshot(mode)
+        # Keep this last as it may run a full garbage collection
+        if self.gcMonitor != None:
+            self.gcMonitor.setMode(mode)
+
     def autonomousInit(self):
+        self.modeChanged("Autonomous")
         autonCommand = oi.instance.getSelectedAuton()
         autonCommand.start()
 
+    def teleopInit(self):
+        self.modeChanged("Teleop")
+
+    def testInit(self):
+        self.modeChanged("Test")
+
     def disabledInit(self):
         """ Cancel current commands running on each subsystem - force back to defaults. """
         list = [ subsystems.drive ]
@@ -33,12 +143,65 @@ class MyRobot(commandbased.CommandBasedRobot):
             if c != None:
                 c.cancel()
 
+        # Publish worst loop overruns (end of a match lands here)
+        if self.overruns != None:
+            table = self.overruns.getTable()
+            SmartDashboard.putNumber("Loop Overruns", self.overruns.count)
+            SmartDashboard.putStringArray("Loop Overrun Log", table)
+            for line in table:
+                print("Overrun: " + line)
+
+        self.modeChanged("Disabled")
+
+    def getModeName(self) -> str:
+        """ Returns name of current robot mode. """
+        if self.isDisabled():
+            return "Disabled"
+        if self.isAutonomous():
+            return "Autonomous"
+        if self.isTest():
+            return "Test"
+        return "Teleop"
+
+    def robotPeriodic(self):
+        """ Runs work registered at reduced rates (low priority work only if there is time left). """
+        rategroups.instance.run()
+
+    def publishBudget(self):
+        """ Publishes how often the loop budget has shed or deferred work. """
+        telemetry.putNumber("Budget Denied Telemetry", budget.instance.denied[budget.kTelemetry])
+        telemetry.putNumber("Budget Denied Diagnostics", budget.instance.denied[budget.kDiagnostics])
+        SmartDashboard.putStringArray("Budget Deferred Tasks", rategroups.instance.getDeferTable())
+
+    def commandPeriodic(self):
+        """ Override base implementation so we can time the scheduler separately from mode handling. """
+        if self.phases != None:
+            self.phases.mark("Mode")
+        super().commandPeriodic()
+        if self.phases != None:
+            self.phases.mark("Commands")
+
+    # Base class binds these to its own commandPeriodic, rebind to our override
+    autonomousPeriodic = commandPeriodic
+    teleopPeriodic = commandPeriodic
+    disabledPeriodic = commandPeriodic
+
     def loopFunc(self):
         """ Override base implementation so we can peek at how long each iteration takes. """
+        budget.instance.begin()
+        if self.phases != None:
+            self.phases.begin()
         super().loopFunc()
+        # Anything after the scheduler (robotPeriodic, SmartDashboard/LiveWindow updates)
+        if self.phases != None:
+            self.phases.mark("Dashboard")
+            self.phases.end()
         # Record how long it took to run iteration of loop
+        runTime: float = self.watchdog.getTime()
         if self.performance != None:
-            self.performance.updateRunTime(self.watchdog.getTime())
+            self.performance.updateRunTime(runTime)
+        if self.overruns != None:
+            self.overruns.check(runTime * 1000.0)
 
 if __name__ == "__main__":
     wpilib.run(MyRobot)
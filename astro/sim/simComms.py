@@ -11,3 +11,14 @@ def resetEncodersSim():
 def getEncoders():
     global encoderReset
     return encoderReset
+
+# Robot position (x ft, y ft, angle radians) from physics simulation (None until first update)
+pose = None
+
+def setPose(x: float, y: float, angle: float):
+    global pose
+    pose = (x, y, angle)
+
+def getPose():
+    global pose
+    return pose
@@ -3,6 +3,9 @@
 
 from .drive import Drive
 from .climber import Climber
+from perf import startup
+import configurator
+from perf import rategroups
 
 drive : Drive = None
 climber : Climber = None
@@ -10,5 +13,16 @@ climber : Climber = None
 def initialize():
     global drive
     global climber
-    drive = Drive()
-    climber = Climber()
+    # Drop periodic work registered by any prior subsystem instances
+    rategroups.instance.clear()
+    with startup.instance.section("Drive()"):
+        drive = Drive()
+    with startup.instance.section("Climber()"):
+        climber = Climber()
+    # Subsystems only queued their motor controller settings, apply them all at once
+    with startup.instance.section("Configure Controllers"):
+        configurator.instance.run()
+    for config in configurator.instance.configs:
+        startup.instance.record("  " + config.label, config.secs)
+        for setting in config.settings:
+            startup.instance.record("    %s.%s" % (config.label, setting.method), setting.secs)
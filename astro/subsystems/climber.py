@@ -2,29 +2,34 @@ import ctre
 from ctre.basemotorcontroller import BaseMotorController
 
 import wpilib
-from wpilib import SmartDashboard
 from wpilib.command.subsystem import Subsystem
 
 import subsystems
 import robotmap
+from perf import rategroups
+import configurator
+import telemetry
 
 # Generic name for this subsystem
 group: str = "Climber"
 # Timeout for CAN commands
 timeout: int = 10
 
-def initializeMotorController(mc: BaseMotorController):
+def initializeMotorController(mc: BaseMotorController, label: str = "Motor") -> configurator.ControllerConfig:
   """
-  Initializes a motor controller to an "initial state" (applies common settings).
+  Queues settings with the configurator to put a motor controller in an "initial state" (common settings).
 
   : param mc : A VictorSPX or TalonSRX to initialize.
+  : param label : Name to report configuration time and failures under.
+  : return : Configuration to add any additional settings to.
   """
+  c = configurator.instance.add(mc, label)
   if not wpilib.RobotBase.isSimulation():
-    mc.configFactoryDefault()
-    mc.configFactoryDefault(timeout)
-    mc.clearStickyFaults(timeout)
-    mc.setSafetyEnabled(False)
-    mc.setNeutralMode(ctre.NeutralMode.Brake)
+    c.add("configFactoryDefault", timeout)
+    c.add("clearStickyFaults", timeout)
+    c.add("setSafetyEnabled", False)
+    c.add("setNeutralMode", ctre.NeutralMode.Brake)
+  return c
 
 class Leg(object):
   """ Helper class to manage a single leg and floor sensor (robot has two). """
@@ -64,13 +69,13 @@ class Leg(object):
     self.floorSensor = wpilib.AnalogInput(floorId)
     self.floorSensor.setName(group, name + " Floor Sensor")
 
-    initializeMotorController(legMotor)
+    c = initializeMotorController(legMotor, name + "Leg")
     legMotor.setName(group, name + " Leg Motor")
-    legMotor.setInverted(True)
-    legMotor.configContinuousCurrentLimit(20, timeout)
-    legMotor.enableCurrentLimit(True)
-    legMotor.configVoltageCompSaturation(9, timeout)
-    legMotor.enableVoltageCompensation(True)
+    c.add("setInverted", True, verify="getInverted")
+    c.add("configContinuousCurrentLimit", 20, timeout)
+    c.add("enableCurrentLimit", True)
+    c.add("configVoltageCompSaturation", 9, timeout)
+    c.add("enableVoltageCompensation", True)
 
     self.legMotor = legMotor
 
@@ -84,6 +89,9 @@ class Leg(object):
     self.extendedCounter = wpilib.Counter(self.extendedSensor)
     self.extendedCounter.setName(group, name + " Extend Count")
 
+    # Resolve dashboard entry once (avoids building key string every update)
+    self.floorVoltsEntry = telemetry.getEntry(name + " Floor Volts")
+
   def isExtended(self) -> bool:
     """
     Determine if leg is position such that the fully extended sensor is tripped.
@@ -166,8 +174,7 @@ class Leg(object):
     """ Periodic checks and dashboard updates. """
     if updateDashboard:
       if self.debug == True:
-        n = self.name
-        SmartDashboard.putNumber(n + " Floor Volts", self.floorSensor.getVoltage())
+        self.floorVoltsEntry.setNumber(self.floorSensor.getVoltage())
 
 
 class Climber(Subsystem):
@@ -179,9 +186,6 @@ class Climber(Subsystem):
   # Set to True for extra diagnostics on SmartDashboard
   debug: bool = False
 
-  # Used to limit how often we update SmartDashboard values
-  periodicCnt: int = 0
-
   # Used to manage front and back legs of robot
   frontLeg: Leg
   backLeg: Leg
@@ -222,16 +226,20 @@ class Climber(Subsystem):
       wheelRightMotor = ctre.WPI_TalonSRX(robotmap.kCanClimbRightWheel)
       wheelRightMotor.setInverted(True)
 
-    initializeMotorController(wheelLeftMotor)
+    initializeMotorController(wheelLeftMotor, "LeftWheel")
     wheelLeftMotor.setName(group, "Left Wheel")
 
-    initializeMotorController(wheelRightMotor)
+    c = initializeMotorController(wheelRightMotor, "RightWheel")
     wheelRightMotor.setName(group, "Right Wheel")
-    wheelRightMotor.follow(wheelLeftMotor)
+    c.add("follow", wheelLeftMotor)
 
     # Operate wheel motors as one unit
     self.wheels = wheelLeftMotor
 
+    # No need to update dashboard values every loop
+    self.leanEntry = telemetry.getEntry("Lean")
+    rategroups.instance.register("Climber Dashboard", self.dashboardPeriodic, 5)
+
   def getFrontLeg(self) -> Leg:
     """
     Get access to sensors and motors associated with leg at front of robot.
@@ -273,13 +281,10 @@ class Climber(Subsystem):
     self.backLeg.setMotorPower(0)
     self.stopWheels()
 
-  def periodic(self):
-    """ Periodic checks, sensor readings and dashboard updates. """
-    self.periodicCnt += 1
-    dashboardUpdate = ((self.periodicCnt % 10) == 0)
-    self.frontLeg.periodic(dashboardUpdate)
-    self.backLeg.periodic(dashboardUpdate)
-    if dashboardUpdate:
-      # Probably always want to see how much the robot is leaning
-      SmartDashboard.putNumber("Lean", self.getLean())
+  def dashboardPeriodic(self):
+    """ Publishes leg sensor readings and how much the robot is leaning. """
+    self.frontLeg.periodic(True)
+    self.backLeg.periodic(True)
+    # Probably always want to see how much the robot is leaning
+    self.leanEntry.setNumber(self.getLean())
 
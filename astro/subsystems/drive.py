@@ -2,11 +2,20 @@ import math
 import ctre
 import navx
 import wpilib
-from wpilib import SmartDashboard
 from wpilib.command.subsystem import Subsystem
 from wpilib.drive.differentialdrive import DifferentialDrive
 import robotmap
 from commands.drive.drivehuman import DriveHuman 
+from subsystems.snapshot import DriveSnapshot, SnapshotHistory
+from subsystems.sensors import Channel, Sensors
+from subsystems.navxreader import NavxReader
+from math5511.odometry import Odometry, Pose, Twist
+import sim.simComms as simComms
+from perf import budget
+from perf import rategroups
+from perf import startup
+import configurator
+import telemetry
 
 kTimeout : int = 0
 
@@ -20,12 +29,10 @@ class Tread():
     """ Helper class that provides common operations for one side of drive train. """
 
     encoder : wpilib.Encoder = None
-    # Counts last read from encoder
-    encCnts : int = 0
-    # Distance last read from encoder
-    encDist : float = 0
-    # Velocity last returned from encoder
-    encVel : float = 0
+    # Encoder counts, distance and velocity (read on demand at most once per cycle)
+    cntsChannel : Channel = None
+    distChannel : Channel = None
+    velChannel : Channel = None
 
     # Main motor controller for motor cluster
     motor: ctre.WPI_TalonSRX = None
@@ -40,19 +47,22 @@ class Tread():
 
     def getDistance(self) -> float:
         """ Returns distance traveled in feet. """
-        return self.encDist
+        return self.distChannel.get()
 
     def getCounts(self) -> int:
-        """ Returns counts last read from encoder. """
-        return self.encCnts
+        """ Returns counts read from encoder. """
+        return self.cntsChannel.get()
 
     def getVelocity(self) -> float:
-        """ Returns velocity last read in ft/sec. """
-        return self.encVel
+        """ Returns velocity read in ft/sec. """
+        return self.velChannel.get()
 
     def zero(self):
         """ Resets the encoder - best to avoid this - may remove eventually. """
         self.encoder.reset()
+        self.cntsChannel.invalidate()
+        self.distChannel.invalidate()
+        self.velChannel.invalidate()
 
     def __setVoltageCompensation__(self, voltage : float) -> None:
         self.motor.configVoltageCompSaturation(voltage, kTimeout)
@@ -71,19 +81,24 @@ class Tread():
 
     @staticmethod
     def createTalonSRX(canId : int, invert : bool) -> ctre.WPI_TalonSRX:
-        """ Helper method to create and initialize a TalonSRX speed controller.
-        
+        """ Helper method to create a TalonSRX speed controller and queue its settings with the configurator.
+
         : param canId : ID on CAN bus of TalonSRX
         : param invert : Pass true if motor output needs to be inverted """
-        s = ctre.WPI_TalonSRX(canId)
-        s.clearStickyFaults(kTimeout)
-        s.setSafetyEnabled(False)
-        s.setInverted(invert)
-        s.configContinuousCurrentLimit(15, kTimeout) #15 Amps per motor
-        s.configPeakCurrentLimit(20, kTimeout) #20 Amps during Peak Duration
-        s.configPeakCurrentDuration(100, kTimeout) #Peak Current for max 100 ms
-        s.enableCurrentLimit(True)
-        s.configOpenLoopRamp(0.2, kTimeout) #number of seconds from 0 to 1
+        with startup.instance.section("TalonSRX(%d)" % canId):
+            s = ctre.WPI_TalonSRX(canId)
+        c = configurator.instance.add(s, "Talon%d" % canId)
+        c.add("clearStickyFaults", kTimeout)
+        c.add("setSafetyEnabled", False)
+        c.add("setInverted", invert, verify="getInverted")
+        c.add("configContinuousCurrentLimit", 15, kTimeout) #15 Amps per motor
+        c.add("configPeakCurrentLimit", 20, kTimeout) #20 Amps during Peak Duration
+        c.add("configPeakCurrentDuration", 100, kTimeout) #Peak Current for max 100 ms
+        c.add("enableCurrentLimit", True)
+        c.add("configOpenLoopRamp", 0.2, kTimeout) #number of seconds from 0 to 1
+        # Default to 12 volts max to motors
+        c.add("configVoltageCompSaturation", 12, kTimeout)
+        c.add("enableVoltageCompensation", True)
         return s
 
     @staticmethod
@@ -93,14 +108,16 @@ class Tread():
         : param leader : The TalonSRX that the VictorSPX should follow
         : param canId : ID on CAN bus of VictorSPX
         : param invert : Pass true if motor output needs to be inverted """
-        s = ctre.WPI_VictorSPX(canId)
-        s.clearStickyFaults(kTimeout)
-        s.setSafetyEnabled(False)
-        s.setInverted(invert)
-        s.follow(leader)
+        with startup.instance.section("VictorSPX(%d)" % canId):
+            s = ctre.WPI_VictorSPX(canId)
+        c = configurator.instance.add(s, "Victor%d" % canId)
+        c.add("clearStickyFaults", kTimeout)
+        c.add("setSafetyEnabled", False)
+        c.add("setInverted", invert, verify="getInverted")
+        c.add("follow", leader)
         return s
 
-    def __init__(self, tname: str, t0: int, v1: int, v2: int, invert: bool, chA: int, chB: int, cntsToFt: float):
+    def __init__(self, tname: str, t0: int, v1: int, v2: int, invert: bool, chA: int, chB: int, cntsToFt: float, sensors: Sensors):
         self.debug = False
         self.name = tname
         self.motor = Tread.createTalonSRX(t0, invert)
@@ -118,22 +135,26 @@ class Tread():
         self.encoder.setName("Drive", tname + "Enc")
         self.encoder.setDistancePerPulse(cntsToFt)
         self.encoder.setSamplesToAverage(10)
-        self.__setVoltageCompensation__(12) # Default to 12 volts max to motors
-        self.__readSensors__()
+        self.__addSensors__(sensors)
+
+        self.currentEntry = telemetry.getEntry(tname + " Talon Current")
+        self.voltsEntry = telemetry.getEntry(tname + " Talon Volts")
+        self.wattsEntry = telemetry.getEntry(tname + " Talon Watts")
 
-    def __readSensors__(self):
-        self.encCnts = self.encoder.get()
-        self.encDist = self.encoder.getDistance()
-        self.encVel = self.encoder.getRate()
+    def __addSensors__(self, sensors: Sensors):
+        prefix: str = self.name.lower()
+        self.cntsChannel = sensors.add(self.name + " Counts", self.encoder.get, prefix + "Cnts")
+        self.distChannel = sensors.add(self.name + " Distance", self.encoder.getDistance, prefix + "Dist")
+        self.velChannel = sensors.add(self.name + " Velocity", self.encoder.getRate, prefix + "Vel")
 
     def __dashboard_periodic__(self):
         if self.debug:
             current = self.motor.getOutputCurrent()
             volts = self.motor.getMotorOutputVoltage()
             watts = volts * current
-            SmartDashboard.putNumber(self.name + " Talon Current", current)
-            SmartDashboard.putNumber(self.name + " Talon Volts", volts)
-            SmartDashboard.putNumber(self.name + " Talon Watts", watts)
+            self.currentEntry.setNumber(current)
+            self.voltsEntry.setNumber(volts)
+            self.wattsEntry.setNumber(watts)
 
 class Drive(Subsystem):
 
@@ -148,17 +169,37 @@ class Drive(Subsystem):
     def __init__(self):
         super().__init__('Drive')
         self.setName("Subsystem", "Drive")
+        # Sensors are only read when something asks for them (at most once per loop)
+        self.history: SnapshotHistory = SnapshotHistory()
+        self.sensors: Sensors = Sensors(self.history, wpilib.Timer.getFPGATimestamp)
 
         self.navx = navx.ahrs.AHRS.create_spi()
         self.navx.setName("Drive", "NavX")
         self.accel = wpilib.BuiltInAccelerometer()
         self.accel.setName("Drive", "Accel")
+
+        # Set NavxHz preference to a rate above 0 to sample the NavX from a background
+        # thread (loop then gets the freshest values without waiting on SPI)
+        self.navxReader: NavxReader = None
+        navxHz: float = robotmap.getConfigFloat("NavxHz", 0.0)
+        ahrs = self.navx
+        if navxHz > 0:
+            self.navxReader = NavxReader(self.navx, navxHz, wpilib.Timer.getFPGATimestamp)
+            self.navxReader.start()
+            ahrs = self.navxReader
+        self.yawChannel: Channel = self.sensors.add("Yaw", ahrs.getYaw, "yaw")
+        self.yawRateChannel: Channel = self.sensors.add("Yaw Rate", ahrs.getRate, "yawRate")
+        self.rollChannel: Channel = self.sensors.add("Roll", ahrs.getRoll, "roll")
+        self.pitchChannel: Channel = self.sensors.add("Pitch", ahrs.getPitch, "pitch")
+        self.accelXChannel: Channel = self.sensors.add("Accel X", self.accel.getX, "accelX")
+        self.accelYChannel: Channel = self.sensors.add("Accel Y", self.accel.getY, "accelY")
+        self.accelZChannel: Channel = self.sensors.add("Accel Z", self.accel.getZ, "accelZ")
         self.left : Tread = Tread("Left", \
             robotmap.kCanDriveLeft0, robotmap.kCanDriveLeft1, robotmap.kCanDriveLeft2, True, \
-            robotmap.kDioDriveLeftEncA, robotmap.kDioDriveLeftEncB, kLeftConv)
+            robotmap.kDioDriveLeftEncA, robotmap.kDioDriveLeftEncB, kLeftConv, self.sensors)
         self.right : Tread = Tread("Right", \
             robotmap.kCanDriveRight0, robotmap.kCanDriveRight1, robotmap.kCanDriveRight2, False, \
-            robotmap.kDioDriveRightEncA, robotmap.kDioDriveRightEncB, kRightConv)
+            robotmap.kDioDriveRightEncA, robotmap.kDioDriveRightEncB, kRightConv, self.sensors)
 
         self.left.debug = self.debug
         self.right.debug = self.debug
@@ -168,8 +209,23 @@ class Drive(Subsystem):
         self.drive.setSafetyEnabled(False)
         self.drive.setDeadband(0.025)
         self.drive.setRightSideInverted(False)
+
+        # Tracks position on field from encoders and NavX (updated every periodic())
+        self.odometry: Odometry = Odometry()
+        # In simulation the odometry is moved to the simulated robot's position once
+        self.simAligned: bool = False
         self.periodic()
         self.zero()
+        self.resetPose(0.0, 0.0, 0.0)
+        self.poseXEntry = telemetry.getEntry("Pose X")
+        self.poseYEntry = telemetry.getEntry("Pose Y")
+        self.poseHeadingEntry = telemetry.getEntry("Pose Heading")
+        self.simPoseErrorEntry = telemetry.getEntry("Sim Pose Error")
+
+        # Dashboard values don't need to be updated every loop
+        rategroups.instance.register("Drive Dashboard", self.dashboardPeriodic, 10)
+        # Shows how many sensor reads are being skipped because nothing asked for them
+        rategroups.instance.register("Drive Sensor Reads", self.publishSensorReads, 1, budget.kDiagnostics)
 
     def initDefaultCommand(self):
         self.setDefaultCommand(DriveHuman())
@@ -223,21 +279,49 @@ class Drive(Subsystem):
 
     def periodic(self):
         """
-        This method is called automatically by the Scheduler and we take our
-        sensor readings once per run cycle here.
+        This method is called automatically by the Scheduler and starts a new
+        sensor cycle here (sensors are read when first asked for during the cycle).
+        Odometry is updated every cycle, so encoder distances and yaw are always read.
         """
-        self.__readSensors__()
-        self.left.__readSensors__()
-        self.right.__readSensors__()
-        self.dashboardPeriodic()
-
-    def __readSensors__(self):
-        self.yaw = self.navx.getYaw()
-        self.roll = self.navx.getRoll()
-        self.pitch = self.navx.getPitch()
-        self.accelX = self.accel.getX()
-        self.accelY = self.accel.getY()
-        self.accelZ = self.accel.getZ()
+        self.sensors.nextCycle()
+        self.odometry.update(self.sensors.snapshot.timestamp, self.left.getDistance(), \
+            self.right.getDistance(), self.getAngleRaw())
+
+    def resetPose(self, x: float, y: float, heading: float):
+        """
+        Sets where the robot is on the field (like at the start of auton).
+
+        : param x : Field position in feet.
+        : param y : Field position in feet.
+        : param heading : Field heading in degrees (clockwise positive like the NavX).
+        """
+        self.odometry.reset(self.sensors.snapshot.timestamp, x, y, heading, \
+            self.left.getDistance(), self.right.getDistance(), self.getAngleRaw())
+
+    def getPose(self) -> Pose:
+        """ Returns position (ft) and heading (degrees) on field as of this cycle (treat as read only). """
+        return self.odometry.getPose()
+
+    def getTwist(self) -> Twist:
+        """ Returns forward velocity (ft/sec) and turn rate (degrees/sec) from odometry. """
+        return self.odometry.getTwist()
+
+    def getPoseAt(self, timestamp: float, out: Pose) -> Pose:
+        """
+        Interpolates where the robot was at an earlier time (like when a camera frame was taken).
+
+        : param timestamp : FPGA time (secs) to look up (about the last second is kept).
+        : param out : Pose to fill in.
+        """
+        return self.odometry.getPoseAt(timestamp, out)
+
+    def getSnapshot(self) -> DriveSnapshot:
+        """ Returns sensor readings taken so far during the current loop (treat as read only, see DriveSnapshot.isValid()). """
+        return self.sensors.snapshot
+
+    def getHistory(self) -> SnapshotHistory:
+        """ Returns the most recent snapshots (use to compute rates without reading hardware again). """
+        return self.history
 
     def getLeft(self) -> Tread:
         """ Use this method if you need specific data or control of the left side of the drive. """
@@ -249,45 +333,53 @@ class Drive(Subsystem):
 
     def getAngle(self) -> float:
         """ Returns angle of rotation since last zeroing. """
-        return self.yaw - self.yawZero
+        return self.yawChannel.get() - self.yawZero
 
     def getAngleRaw(self) -> float:
         """ Returns raw angle from NavX (never zeroed). """
-        return self.yaw
+        return self.yawChannel.get()
+
+    def getYawRate(self) -> float:
+        """ Returns angular rate (degrees/sec) around the yaw axis. """
+        return self.yawRateChannel.get()
+
+    def getNavxReader(self) -> NavxReader:
+        """ Returns background NavX sampler (None if not enabled by the NavxHz preference). """
+        return self.navxReader
 
     def getRoll(self) -> float:
         """
         Returns roll angle since last zeroing.
         : return : Roll reading in degrees from NavX since last zeroing.
         """
-        return self.roll - self.rollZero
+        return self.rollChannel.get() - self.rollZero
 
     def getRollRaw(self) -> float:
         """
         Returns raw roll value from NavX (never zeroed).
         """
-        return self.roll
+        return self.rollChannel.get()
 
     def getPitch(self) -> float:
         """
         Returns pitch angle since last zeroing.
         : return : Pitch reading in degrees from NavX since last zeroing.
         """
-        return self.pitch - self.pitchZero
+        return self.pitchChannel.get() - self.pitchZero
 
     def getPitchRaw(self) -> float:
         """
         Returns raw pitch value from NavX (never zeroed).
         """
-        return self.pitch
+        return self.pitchChannel.get()
 
     def getAccelX(self) -> float:
         """ Returns acceleration in X-axis reported by built in accelerameter. """
-        return self.accelX
+        return self.accelXChannel.get()
 
     def getAccelY(self) -> float:
         """ Returns acceleration in Y-axis reported by built in accelerameter. """
-        return self.accelY
+        return self.accelYChannel.get()
 
     def getAvgDistance(self):
         """ Returns average of distance of left and right side encoders. """
@@ -310,15 +402,16 @@ class Drive(Subsystem):
         return (abs(self.left.getVelocity()) + abs(self.right.getVelocity())) / 2
 
     def zeroDistance(self):
-        """ Zeros out tracked encoder values. """
+        """ Zeros out tracked encoder values (field pose is not affected). """
         self.left.zero()
         self.right.zero()
+        self.odometry.resetEncoders(self.left.getDistance(), self.right.getDistance())
 
     def zeroAngle(self):
         """ Zeros out tracked angle information. """
-        self.yawZero = self.yaw
-        self.rollZero = self.roll
-        self.pitchZero = self.roll
+        self.yawZero = self.getAngleRaw()
+        self.rollZero = self.getRollRaw()
+        self.pitchZero = self.getRollRaw()
 
     def zero(self):
         """ Zeros out tracked distance and angle information. """
@@ -329,8 +422,33 @@ class Drive(Subsystem):
         """ Stops all drive motors. """
         self.setPower(0, 0)
 
+    def publishSensorReads(self):
+        """ Publishes per channel "reads/cycles requests name" counters. """
+        wpilib.SmartDashboard.putStringArray("Drive Sensor Reads", self.sensors.getTable())
+
     def dashboardPeriodic(self):
-        pass
+        """ Publishes tread readings and the odometry pose. """
+        self.left.__dashboard_periodic__()
+        self.right.__dashboard_periodic__()
+        pose: Pose = self.odometry.getPose()
+        self.poseXEntry.setNumber(pose.x)
+        self.poseYEntry.setNumber(pose.y)
+        self.poseHeadingEntry.setNumber(pose.heading)
+        if wpilib.RobotBase.isSimulation():
+            self.__checkSimPose__()
+
+    def __checkSimPose__(self):
+        """ Publishes how far odometry is from where the physics simulation has the robot. """
+        simPose = simComms.getPose()
+        if simPose == None:
+            return
+        x, y, angle = simPose
+        if not self.simAligned:
+            self.resetPose(x, y, math.degrees(angle))
+            self.simAligned = True
+            return
+        pose: Pose = self.odometry.getPose()
+        self.simPoseErrorEntry.setNumber(math.hypot(pose.x - x, pose.y - y))
 
     def bumpCheck(self, bumpX: float = 0.4, bumpY: float = 0.4) -> bool:
         ''' Returns true if magnitude of acceleration from built in 
@@ -0,0 +1,166 @@
+import threading
+import time
+
+# Default rate to sample the NavX at (it updates internally at up to 200 Hz)
+kDefaultHz: float = 200.0
+
+# Smoothing applied to angular rate (0 is no smoothing, closer to 1 is smoother)
+kRateSmoothing: float = 0.5
+
+class NavxRecord():
+    """ One set of NavX readings (degrees) and when they were taken. """
+
+    __slots__ = ("seq", "timestamp", "yaw", "roll", "pitch", "angle", "rate")
+
+    def __init__(self):
+        # Odd while being written (see NavxReader.read())
+        self.seq: int = 0
+        self.timestamp: float = 0.0
+        # Yaw as reported [-180, +180]
+        self.yaw: float = 0.0
+        self.roll: float = 0.0
+        self.pitch: float = 0.0
+        # Yaw accumulated across the +/-180 wrap (continuous heading)
+        self.angle: float = 0.0
+        # Rate of change of angle (degrees/sec)
+        self.rate: float = 0.0
+
+    def copyFrom(self, other):
+        self.timestamp = other.timestamp
+        self.yaw = other.yaw
+        self.roll = other.roll
+        self.pitch = other.pitch
+        self.angle = other.angle
+        self.rate = other.rate
+
+
+class NavxReader():
+    """
+    Samples the NavX on a background thread faster than the main robot loop runs.
+
+    Samples go into two preallocated records: the thread fills the one that is
+    not published and then publishes it by swapping a single reference, so the
+    main loop reads the latest values without taking a lock or waiting on the
+    sensor. Each sample also unwraps yaw into a continuous angle and
+    integrates the change between samples into an angular rate.
+
+    The getters (like getYaw()) let the reader stand in for the AHRS object.
+    Each one reads a single field of the published record, so it always gets a
+    whole value from a complete sample, but two getters called back to back may
+    see different samples. Drive reads its NavX channels independently and on
+    demand, so that is no worse than reading the AHRS directly. Use read() when
+    several values must come from the same sample.
+    """
+    def __init__(self, ahrs, hz: float = kDefaultHz, clock = time.monotonic):
+        """
+        : param ahrs : NavX AHRS object (anything with getYaw(), getRoll() and getPitch()).
+        : param hz : Rate to sample at.
+        : param clock : Function returning monotonic time in seconds (like Timer.getFPGATimestamp).
+        """
+        self.ahrs = ahrs
+        self.hz: float = hz
+        self.clock = clock
+        self.records = (NavxRecord(), NavxRecord())
+        # Record published to readers (the other one is written next)
+        self.latest: NavxRecord = self.records[0]
+        # Number of samples taken and number of times the thread fell a full period behind
+        self.samples: int = 0
+        self.overruns: int = 0
+        self.thread: threading.Thread = None
+        self.stopEvent: threading.Event = threading.Event()
+
+    def start(self):
+        """ Takes a first sample and starts the background thread (does nothing if already running). """
+        if self.thread != None:
+            return
+        self.sample()
+        self.stopEvent.clear()
+        self.thread = threading.Thread(target=self.__run__, name="NavxReader", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """ Stops the background thread. """
+        if self.thread == None:
+            return
+        self.stopEvent.set()
+        self.thread.join()
+        self.thread = None
+
+    def __run__(self):
+        period: float = 1.0 / self.hz
+        deadline: float = time.perf_counter()
+        while True:
+            deadline += period
+            delay: float = deadline - time.perf_counter()
+            if delay < 0:
+                # Fell behind, don't try to catch up with a burst of samples
+                self.overruns += 1
+                deadline -= delay
+                delay = 0
+            if self.stopEvent.wait(delay):
+                break
+            self.sample()
+
+    def sample(self):
+        """ Reads the NavX into the unpublished record and publishes it (called by the background thread). """
+        prior: NavxRecord = self.latest
+        rec: NavxRecord = self.records[1] if prior is self.records[0] else self.records[0]
+        rec.seq += 1
+        rec.timestamp = self.clock()
+        rec.yaw = yaw = self.ahrs.getYaw()
+        rec.roll = self.ahrs.getRoll()
+        rec.pitch = self.ahrs.getPitch()
+        if self.samples == 0:
+            rec.angle = yaw
+            rec.rate = 0.0
+        else:
+            delta: float = yaw - prior.yaw
+            if delta > 180.0:
+                delta -= 360.0
+            elif delta < -180.0:
+                delta += 360.0
+            rec.angle = prior.angle + delta
+            dt: float = rec.timestamp - prior.timestamp
+            if dt > 0:
+                rec.rate = kRateSmoothing * prior.rate + (1.0 - kRateSmoothing) * (delta / dt)
+            else:
+                rec.rate = prior.rate
+        rec.seq += 1
+        self.latest = rec
+        self.samples += 1
+
+    def read(self, out: NavxRecord) -> NavxRecord:
+        """
+        Copies the latest sample (all values from the same sample) without blocking.
+        : param out : Record to copy into (reuse one to avoid allocating).
+        : return : The out record.
+        """
+        while True:
+            rec: NavxRecord = self.latest
+            seq: int = rec.seq
+            out.copyFrom(rec)
+            # Retry in the rare case the thread started rewriting the record while we copied it
+            if (seq & 1) == 0 and rec.seq == seq:
+                out.seq = seq
+                return out
+
+    def getYaw(self) -> float:
+        return self.latest.yaw
+
+    def getRoll(self) -> float:
+        return self.latest.roll
+
+    def getPitch(self) -> float:
+        return self.latest.pitch
+
+    def getAngle(self) -> float:
+        """ Returns continuous yaw (not wrapped to [-180, +180]). """
+        return self.latest.angle
+
+    def getRate(self) -> float:
+        """ Returns angular rate (degrees/sec) around the yaw axis. """
+        return self.latest.rate
+
+    def getAge(self) -> float:
+        """ Returns seconds since the latest sample was taken. """
+        return self.clock() - self.latest.timestamp
@@ -0,0 +1,93 @@
+from subsystems.snapshot import DriveSnapshot, SnapshotHistory, kValidBits
+
+class Channel():
+    """
+    A single sensor reading (like NavX yaw) that is read from hardware at most
+    once per cycle and only when something asks for it.
+    """
+
+    __slots__ = ("name", "read", "attr", "bit", "sensors", "cycle", "value", "reads", "requests")
+
+    def __init__(self, sensors, name: str, read, attr: str):
+        """
+        : param sensors : Sensors object that tracks the current cycle.
+        : param name : Name of channel (for reporting).
+        : param read : Function taking no arguments that reads the hardware.
+        : param attr : Name of DriveSnapshot field to record the reading in.
+        """
+        self.name: str = name
+        self.read = read
+        self.attr: str = attr
+        self.bit: int = kValidBits[attr]
+        self.sensors = sensors
+        # Cycle value was last read in (-1 forces the next get() to read)
+        self.cycle: int = -1
+        self.value = 0
+        # Number of hardware reads and number of get() calls
+        self.reads: int = 0
+        self.requests: int = 0
+
+    def get(self):
+        """ Returns reading for the current cycle (reading the hardware if not already read this cycle). """
+        self.requests += 1
+        sensors = self.sensors
+        if self.cycle != sensors.cycle:
+            self.cycle = sensors.cycle
+            self.value = value = self.read()
+            self.reads += 1
+            s: DriveSnapshot = sensors.snapshot
+            setattr(s, self.attr, value)
+            s.valid |= self.bit
+        return self.value
+
+    def invalidate(self):
+        """ Forces the next get() to read the hardware (use after zeroing a sensor). """
+        self.cycle = -1
+
+
+class Sensors():
+    """
+    Demand driven access to the drive's sensors.
+
+    Each loop nextCycle() starts a new DriveSnapshot, but no hardware is read
+    until a Channel is asked for its value. Channels nobody asks for during a
+    cycle cost nothing and are not marked valid in that cycle's snapshot.
+    Counters on each channel show how many reads were saved.
+    """
+    def __init__(self, history: SnapshotHistory, clock):
+        """
+        : param history : Ring of snapshots to record readings in.
+        : param clock : Function returning monotonic time in seconds (like Timer.getFPGATimestamp).
+        """
+        self.history: SnapshotHistory = history
+        self.clock = clock
+        self.channels: list = []
+        # Number of cycles started
+        self.cycle: int = 0
+        self.snapshot: DriveSnapshot = None
+        self.nextCycle()
+
+    def add(self, name: str, read, attr: str) -> Channel:
+        """
+        Adds a sensor channel.
+
+        : param name : Name of channel (for reporting).
+        : param read : Function taking no arguments that reads the hardware.
+        : param attr : Name of DriveSnapshot field to record the reading in.
+        """
+        channel: Channel = Channel(self, name, read, attr)
+        self.channels.append(channel)
+        return channel
+
+    def nextCycle(self):
+        """ Starts a new cycle (call once per loop before anything asks for readings). """
+        self.cycle += 1
+        s: DriveSnapshot = self.history.next()
+        s.timestamp = self.clock()
+        s.cycle = self.cycle
+        s.valid = 0
+        self.snapshot = s
+
+    def getTable(self) -> list:
+        """ Returns formatted "reads/cycles requests name" lines for each channel. """
+        return [ "%d/%d %d %s" % (c.reads, self.cycle, c.requests, c.name) for c in self.channels ]
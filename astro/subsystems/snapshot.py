@@ -0,0 +1,114 @@
+# Number of snapshots the drive keeps
+kHistorySize: int = 16
+
+# Names of readings held in a snapshot
+kReadings = ("yaw", "yawRate", "roll", "pitch", "accelX", "accelY", "accelZ", \
+    "leftCnts", "leftDist", "leftVel", "rightCnts", "rightDist", "rightVel")
+
+# Bit set in DriveSnapshot.valid for each reading
+kValidBits = { name: 1 << i for i, name in enumerate(kReadings) }
+
+class DriveSnapshot():
+    """
+    Drive sensor readings taken at the same time (once per loop).
+
+    Sensors are only read when asked for, so check isValid() before using a
+    field directly (the Drive getters read the sensor if needed).
+
+    Commands should treat snapshots as read only. Snapshots are preallocated and
+    refilled in place by SnapshotHistory, so a reference to one is only good for
+    the size of the history (copy() it to hold on to it longer).
+    """
+
+    __slots__ = ("timestamp", "cycle", "valid") + kReadings
+
+    def __init__(self):
+        # Time (secs, monotonic FPGA clock) readings were taken and loop cycle they were taken in
+        self.timestamp: float = 0.0
+        self.cycle: int = 0
+        # Bits (see kValidBits) of readings actually taken this cycle (sensors are read on demand)
+        self.valid: int = 0
+        # NavX angles (degrees, raw - not zeroed)
+        self.yaw: float = 0.0
+        # Angular rate around yaw axis (degrees/sec)
+        self.yawRate: float = 0.0
+        self.roll: float = 0.0
+        self.pitch: float = 0.0
+        # Built in accelerometer (g)
+        self.accelX: float = 0.0
+        self.accelY: float = 0.0
+        self.accelZ: float = 0.0
+        # Encoder counts, distance (ft) and velocity (ft/sec) of each side
+        self.leftCnts: int = 0
+        self.leftDist: float = 0.0
+        self.leftVel: float = 0.0
+        self.rightCnts: int = 0
+        self.rightDist: float = 0.0
+        self.rightVel: float = 0.0
+
+    def isValid(self, name: str) -> bool:
+        """ Returns True if the reading (like "yaw") was taken during this snapshot's cycle. """
+        return (self.valid & kValidBits[name]) != 0
+
+    def copy(self):
+        """ Returns a new snapshot with the same values (safe to keep indefinitely). """
+        s: DriveSnapshot = DriveSnapshot()
+        for name in DriveSnapshot.__slots__:
+            setattr(s, name, getattr(self, name))
+        return s
+
+
+class SnapshotHistory():
+    """ Preallocated ring of the most recent DriveSnapshot objects (no allocation once constructed). """
+    def __init__(self, size: int = kHistorySize):
+        """
+        : param size : Number of snapshots to keep (at least 2).
+        """
+        self.__size: int = max(2, size)
+        self.__snapshots: list = [ DriveSnapshot() for _ in range(self.__size) ]
+        # Total number of snapshots ever taken (ring position of next is __added % __size)
+        self.__added: int = 0
+
+    def getSize(self) -> int:
+        """ Returns maximum number of snapshots kept. """
+        return self.__size
+
+    def getCount(self) -> int:
+        """ Returns number of snapshots available (up to getSize()). """
+        return min(self.__added, self.__size)
+
+    def next(self) -> DriveSnapshot:
+        """ Returns the oldest snapshot to refill, it becomes the latest. """
+        s: DriveSnapshot = self.__snapshots[self.__added % self.__size]
+        self.__added += 1
+        return s
+
+    def get(self, age: int = 0) -> DriveSnapshot:
+        """
+        : param age : 0 for the latest snapshot, 1 for the one before it, etc (clamped to oldest available).
+        : return : Snapshot (None if nothing has been captured yet).
+        """
+        if self.__added == 0:
+            return None
+        age = min(age, self.getCount() - 1)
+        return self.__snapshots[(self.__added - 1 - age) % self.__size]
+
+    def getRate(self, name: str, age: int = 1) -> float:
+        """
+        Returns how fast a reading is changing (per second) between an older snapshot and the latest one
+        (0 if the reading was not taken in both).
+
+        : param name : Name of reading (like "yaw" or "leftDist").
+        : param age : How many snapshots back to compare against.
+        """
+        latest: DriveSnapshot = self.get(0)
+        older: DriveSnapshot = self.get(age)
+        if latest == None or latest is older:
+            return 0.0
+        bit: int = kValidBits[name]
+        if (latest.valid & older.valid & bit) == 0:
+            return 0.0
+        dt: float = latest.timestamp - older.timestamp
+        if dt <= 0:
+            return 0.0
+        return (getattr(latest, name) - getattr(older, name)) / dt
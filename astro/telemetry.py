@@ -0,0 +1,207 @@
+import threading
+from wpilib import SmartDashboard
+
+# Default rate that queued values are flushed to NetworkTables
+kFlushHz: float = 25.0
+
+# Types of values an Entry can hold
+kNumber: int = 0
+kBoolean: int = 1
+kString: int = 2
+
+class Entry():
+    """
+    Handle to a single dashboard value.
+
+    The NetworkTables entry is looked up once when the Entry is created, so
+    hot path code that keeps the Entry avoids building key strings and doing
+    key lookups every loop.
+    """
+
+    __slots__ = ("key", "nt", "publisher", "last", "epsilon", "kind", "value", "dirty")
+
+    def __init__(self, publisher, key: str):
+        """
+        : param publisher : Publisher that queues and flushes our values.
+        : param key : SmartDashboard key.
+        """
+        self.key: str = key
+        self.nt = SmartDashboard.getEntry(key)
+        self.publisher = publisher
+        # Last value written (used to skip unchanged writes)
+        self.last = None
+        # Changes to numbers less than or equal to this are not written
+        self.epsilon: float = 0.0
+        # Pending value (and its type) waiting to be flushed
+        self.kind: int = kNumber
+        self.value = None
+        self.dirty: bool = False
+
+    def setEpsilon(self, epsilon: float):
+        """ Sets how much a number must change before it is written again. """
+        self.epsilon = epsilon
+
+    def setNumber(self, value: float):
+        last = self.last
+        if last != None and abs(value - last) <= self.epsilon:
+            self.publisher.skipped += 1
+            return
+        self.last = value
+        self.publisher.queue(self, kNumber, value)
+
+    def setBoolean(self, value: bool):
+        if self.last == value:
+            self.publisher.skipped += 1
+            return
+        self.last = value
+        self.publisher.queue(self, kBoolean, value)
+
+    def setString(self, value: str):
+        if self.last == value:
+            self.publisher.skipped += 1
+            return
+        self.last = value
+        self.publisher.queue(self, kString, value)
+
+    def write(self, kind: int, value):
+        """ Writes value to NetworkTables immediately. """
+        if kind == kNumber:
+            self.nt.setDouble(value)
+        elif kind == kBoolean:
+            self.nt.setBoolean(value)
+        else:
+            self.nt.setString(value)
+
+
+class Publisher():
+    """
+    Moves SmartDashboard writes off of the main robot loop.
+
+    The loop writes into Entry objects (latest value wins, so repeated writes
+    to the same key coalesce) and a background thread flushes the entries that
+    changed to NetworkTables at a fixed rate. Until start() is called, writes
+    go straight to NetworkTables.
+
+    Writes are also skipped entirely when the value is the same as the last one
+    written for the key (or, for numbers, within the key's epsilon).
+    """
+    def __init__(self, hz: float = kFlushHz):
+        """
+        : param hz : Rate to flush queued values at.
+        """
+        self.hz: float = hz
+        self.lock: threading.Lock = threading.Lock()
+        # Entries created so far (keyed by SmartDashboard key)
+        self.entries = {}
+        # Entries with values waiting to be flushed
+        self.dirty: list = []
+        # Number of writes accepted, skipped as unchanged and actually sent to NetworkTables
+        self.writes: int = 0
+        self.skipped: int = 0
+        self.flushed: int = 0
+        self.thread: threading.Thread = None
+        self.stopEvent: threading.Event = threading.Event()
+
+    def start(self):
+        """ Starts the background flush thread (does nothing if already running). """
+        if self.thread != None:
+            return
+        self.stopEvent.clear()
+        self.thread = threading.Thread(target=self.__run__, name="TelemetryPublisher", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """ Stops the background thread (after a final flush). """
+        if self.thread == None:
+            return
+        self.stopEvent.set()
+        self.thread.join()
+        self.thread = None
+        self.flush()
+
+    def __run__(self):
+        period: float = 1.0 / self.hz
+        while not self.stopEvent.wait(period):
+            self.flush()
+
+    def getEntry(self, key: str) -> Entry:
+        """ Returns the Entry for a key (created on first request and reused after). """
+        entry: Entry = self.entries.get(key)
+        if entry == None:
+            entry = Entry(self, key)
+            self.entries[key] = entry
+        return entry
+
+    def setEpsilon(self, key: str, epsilon: float):
+        """
+        Sets how much a number must change before it is written again.
+        : param key : Dashboard key.
+        : param epsilon : Changes smaller than or equal to this are not written.
+        """
+        self.getEntry(key).setEpsilon(epsilon)
+
+    def invalidate(self):
+        """ Forgets last values written so the next write of every key goes through. """
+        for entry in self.entries.values():
+            entry.last = None
+
+    def queue(self, entry: Entry, kind: int, value):
+        """ Queues a changed value for the background thread (or writes it now if not started). """
+        if self.thread == None:
+            entry.write(kind, value)
+            return
+        with self.lock:
+            entry.kind = kind
+            entry.value = value
+            if not entry.dirty:
+                entry.dirty = True
+                self.dirty.append(entry)
+            self.writes += 1
+
+    def putNumber(self, key: str, value: float):
+        self.getEntry(key).setNumber(value)
+
+    def putBoolean(self, key: str, value: bool):
+        self.getEntry(key).setBoolean(value)
+
+    def putString(self, key: str, value: str):
+        self.getEntry(key).setString(value)
+
+    def flush(self):
+        """ Sends all queued values to NetworkTables (called by background thread). """
+        with self.lock:
+            pending = [(e, e.kind, e.value) for e in self.dirty]
+            for e in self.dirty:
+                e.dirty = False
+            self.dirty.clear()
+        for entry, kind, value in pending:
+            entry.write(kind, value)
+        self.flushed += len(pending)
+
+
+""" Single instance used by commands and subsystems """
+instance: Publisher = Publisher()
+
+def start():
+    """ Starts flushing dashboard values from a background thread. """
+    instance.start()
+
+def getEntry(key: str) -> Entry:
+    """ Returns a reusable handle for a dashboard key (resolve once, then write through it). """
+    return instance.getEntry(key)
+
+def setEpsilon(key: str, epsilon: float):
+    """ Sets how much a number must change before it is written again. """
+    instance.setEpsilon(key, epsilon)
+
+def putNumber(key: str, value: float):
+    """ Drop in replacement for SmartDashboard.putNumber(). """
+    instance.putNumber(key, value)
+
+def putBoolean(key: str, value: bool):
+    """ Drop in replacement for SmartDashboard.putBoolean(). """
+    instance.putBoolean(key, value)
+
+def putString(key: str, value: str):
+    """ Drop in replacement for SmartDashboard.putString(). """
+    instance.putString(key, value)
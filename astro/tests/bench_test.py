@@ -0,0 +1,22 @@
+'''
+    Smoke tests for the command line benchmark runner (python3 -m perf.bench).
+'''
+
+import json
+from perf import bench
+
+def test_list(capsys):
+    assert bench.main([ "--list" ]) == 0
+    names = capsys.readouterr().out.split()
+    assert "float_math" in names
+    assert "method_calls" in names
+
+
+def test_run(capsys, tmp_path):
+    path = str(tmp_path / "bench.json")
+    assert bench.main([ "--kernels", "float_math", "--trials", "1", "--warmups", "0", "--target", "0.01", "--json", path ]) == 0
+    rows = capsys.readouterr().out.splitlines()
+    assert rows[1].startswith("float_math ")
+    with open(path) as f:
+        results = json.load(f)
+    assert [ k["name"] for k in results["kernels"] ] == [ "float_math" ]
@@ -0,0 +1,76 @@
+'''
+    Checks that motor controller settings are applied in parallel and verified
+    (uses fake controllers that take time to respond like CAN calls do).
+'''
+
+import time
+import configurator
+
+# Seconds each fake configuration call blocks for
+kLatency = 0.02
+
+class FakeController():
+    def __init__(self, failCalls=0, ignoreInvert=False):
+        self.inverted = False
+        self.failCalls = failCalls
+        self.ignoreInvert = ignoreInvert
+        self.calls = []
+
+    def configOpenLoopRamp(self, secs, timeout):
+        time.sleep(kLatency)
+        self.calls.append("configOpenLoopRamp")
+        if self.failCalls > 0:
+            self.failCalls -= 1
+            return -2
+        return 0
+
+    def setInverted(self, invert):
+        self.calls.append("setInverted")
+        if not self.ignoreInvert:
+            self.inverted = invert
+
+    def getInverted(self):
+        return self.inverted
+
+
+def createConfigurator(controllers):
+    c = configurator.Configurator()
+    for i, mc in enumerate(controllers):
+        cfg = c.add(mc, "Fake%d" % i)
+        for _ in range(3):
+            cfg.add("configOpenLoopRamp", 0.2, 10)
+        cfg.add("setInverted", True, verify="getInverted")
+    return c
+
+
+def test_parallel():
+    controllers = [ FakeController() for _ in range(6) ]
+    c = createConfigurator(controllers)
+    assert c.run()
+    # Serial would take 6 * 3 * kLatency
+    assert c.getSerialSecs() >= 18 * kLatency
+    assert c.elapsed < c.getSerialSecs() / 2
+    for mc in controllers:
+        assert mc.inverted
+        assert mc.calls == [ "configOpenLoopRamp" ] * 3 + [ "setInverted" ]
+    assert len(c.getTable()) == 6
+    # Each call is timed on its own
+    for config in c.configs:
+        assert all(s.secs >= kLatency for s in config.settings[:3])
+        assert config.settings[3].secs < kLatency
+    assert len(c.pending) == 0
+
+
+def test_retry():
+    mc = FakeController(failCalls=1)
+    c = createConfigurator([ mc ])
+    assert c.run()
+    assert len(mc.calls) == 8
+
+
+def test_failures():
+    c = createConfigurator([ FakeController(), FakeController(failCalls=10, ignoreInvert=True) ])
+    assert not c.run()
+    assert "Fake1.configOpenLoopRamp returned -2" in c.failures
+    assert "Fake1.getInverted is False (expected True)" in c.failures
+    assert not any(f.startswith("Fake0") for f in c.failures)
@@ -0,0 +1,97 @@
+'''
+    Checks the background NavX reader with a fake AHRS and a clock the test controls.
+'''
+
+import time
+from subsystems.navxreader import NavxReader, NavxRecord
+
+class FakeAHRS():
+    def __init__(self):
+        self.yaw = 0.0
+        self.roll = 0.0
+        self.pitch = 0.0
+
+    def getYaw(self):
+        return self.yaw
+
+    def getRoll(self):
+        return self.roll
+
+    def getPitch(self):
+        return self.pitch
+
+
+class FakeClock():
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def sampleAt(reader, ahrs, clock, t, yaw):
+    clock.now = t
+    ahrs.yaw = yaw
+    ahrs.roll = ahrs.pitch = yaw / 10.0
+    reader.sample()
+
+
+def test_wrap():
+    ahrs = FakeAHRS()
+    clock = FakeClock()
+    reader = NavxReader(ahrs, clock=clock)
+    # Turn clockwise through +180 and back counter clockwise through it
+    yaws = [ 170.0, 175.0, -179.0, -170.0, 179.0, 172.0 ]
+    for i, yaw in enumerate(yaws):
+        sampleAt(reader, ahrs, clock, i * 0.01, yaw)
+    assert reader.getYaw() == 172.0
+    assert abs(reader.getAngle() - 172.0) < 1e-9
+    sampleAt(reader, ahrs, clock, 0.06, -175.0)
+    assert abs(reader.getAngle() - 185.0) < 1e-9
+
+
+def test_rate():
+    ahrs = FakeAHRS()
+    clock = FakeClock()
+    reader = NavxReader(ahrs, clock=clock)
+    # Steady 100 degrees/sec across the wrap, smoothed rate should converge on it
+    for i in range(60):
+        sampleAt(reader, ahrs, clock, i * 0.005, ((170.0 + i * 0.5) + 180.0) % 360.0 - 180.0)
+    assert abs(reader.getRate() - 100.0) < 1e-6
+    clock.now += 0.25
+    assert abs(reader.getAge() - 0.25) < 1e-9
+
+
+def test_read():
+    ahrs = FakeAHRS()
+    clock = FakeClock()
+    reader = NavxReader(ahrs, clock=clock)
+    out = NavxRecord()
+    for i in range(5):
+        sampleAt(reader, ahrs, clock, i * 0.01, i * 10.0)
+        assert reader.read(out) is out
+        assert out.seq % 2 == 0
+        # All values from the latest sample
+        assert out.timestamp == i * 0.01
+        assert out.yaw == i * 10.0
+        assert out.roll == out.pitch == i
+        assert out.angle == i * 10.0
+    assert reader.samples == 5
+
+
+def test_thread():
+    ahrs = FakeAHRS()
+    reader = NavxReader(ahrs, 500.0)
+    reader.start()
+    try:
+        ahrs.yaw = 45.0
+        deadline = time.monotonic() + 2.0
+        while reader.getYaw() != 45.0 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert reader.getYaw() == 45.0
+    finally:
+        reader.stop()
+    assert reader.thread == None
+    samples = reader.samples
+    time.sleep(0.02)
+    assert reader.samples == samples
@@ -0,0 +1,60 @@
+'''
+    Checks odometry against a differential drive driving a known arc (the
+    same kind of motion pyfrc's tank model produces in physics.py).
+'''
+
+import math
+from math5511.odometry import Odometry, Pose, normalizeDegrees
+
+# Robot wheelbase width (ft), forward speed (ft/sec) and clockwise turn rate (rad/sec)
+kWidth = 28 / 12
+kSpeed = 6.0
+kRate = 1.5
+
+def driveArc(odometry, secs, dt=0.02):
+    t = 0.0
+    while t < secs - 1e-9:
+        t += dt
+        left = (kSpeed + kRate * kWidth / 2) * t
+        right = (kSpeed - kRate * kWidth / 2) * t
+        odometry.update(t, left, right, math.degrees(kRate * t))
+    return t
+
+
+def test_arc():
+    odometry = Odometry()
+    odometry.reset(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    t = driveArc(odometry, 3.0)
+    radius = kSpeed / kRate
+    pose = odometry.getPose()
+    assert abs(pose.x - radius * math.sin(kRate * t)) < 0.01
+    assert abs(pose.y - radius * (1 - math.cos(kRate * t))) < 0.01
+    assert abs(pose.heading - normalizeDegrees(math.degrees(kRate * t))) < 1e-6
+    twist = odometry.getTwist()
+    assert abs(twist.velocity - kSpeed) < 1e-6
+    assert abs(twist.rate - math.degrees(kRate)) < 1e-6
+
+
+def test_reset_offsets():
+    odometry = Odometry()
+    # Start on field facing backward with gyro reading 30 degrees
+    odometry.reset(0.0, 52.0, 10.0, 180.0, 5.0, 5.0, 30.0)
+    odometry.update(1.0, 7.0, 7.0, 30.0)
+    pose = odometry.getPose()
+    assert abs(pose.x - 50.0) < 1e-9
+    assert abs(pose.y - 10.0) < 1e-9
+    assert abs(abs(pose.heading) - 180.0) < 1e-9
+
+
+def test_history():
+    odometry = Odometry(10)
+    odometry.reset(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    for i in range(1, 21):
+        odometry.update(i * 0.02, i * 0.1, i * 0.1, 0.0)
+    assert odometry.getCount() == 10
+    out = Pose()
+    odometry.getPoseAt(0.35, out)
+    assert abs(out.x - 1.75) < 1e-9
+    # Clamped to newest and oldest kept
+    assert abs(odometry.getPoseAt(1.0, out).x - 2.0) < 1e-9
+    assert abs(odometry.getPoseAt(0.0, out).x - 1.1) < 1e-9
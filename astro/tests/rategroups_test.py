@@ -0,0 +1,57 @@
+'''
+    Checks that rate groups run work at the requested rates and spread it out.
+'''
+
+import pytest
+from perf import budget
+from perf.rategroups import RateGroups
+
+def countRuns(groups, ticks):
+    for _ in range(ticks):
+        groups.run()
+
+
+def test_rates():
+    groups = RateGroups(50)
+    counts = { "10": 0, "1": 0, "0.5": 0 }
+    for hz in counts.keys():
+        def work(key=hz):
+            counts[key] += 1
+        groups.register(hz, work, float(hz), budget.kControl)
+    countRuns(groups, 200)
+    assert counts == { "10": 40, "1": 4, "0.5": 2 }
+    # Load table grows to cover the 100 tick cycle of the 0.5 Hz task
+    assert len(groups.load) == 100
+
+
+def test_spread():
+    groups = RateGroups(50)
+    for i in range(5):
+        groups.register("%d" % i, lambda: None, 10, budget.kControl)
+    # Five 10 Hz tasks should each get their own tick
+    assert sorted(task.offset for task in groups.tasks) == [0, 1, 2, 3, 4]
+    assert max(groups.load) == 1
+
+
+def test_odd_dividers():
+    groups = RateGroups(50)
+    groups.register("a", lambda: None, 50 / 3, budget.kControl)
+    groups.register("b", lambda: None, 50 / 7, budget.kControl)
+    groups.register("c", lambda: None, 0.2, budget.kControl)
+    assert len(groups.load) % 3 == 0
+    assert len(groups.load) % 7 == 0
+    assert len(groups.load) % 250 == 0
+
+
+def test_clear():
+    groups = RateGroups(50)
+    groups.register("a", lambda: None, 0.5)
+    groups.clear()
+    assert groups.tasks == []
+    assert len(groups.load) == 50
+
+
+def test_invalid_rate():
+    groups = RateGroups(50)
+    with pytest.raises(ValueError):
+        groups.register("a", lambda: None, 0)
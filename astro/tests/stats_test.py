@@ -0,0 +1,101 @@
+'''
+    Checks the statistics helpers against brute force calculations.
+'''
+
+import random
+import pytest
+from math5511.stats import Histogram, Stats, WindowStats
+
+def test_window():
+    rng = random.Random(5511)
+    stats = WindowStats(7)
+    vals = []
+    # Enough values to wrap the ring several times, with repeats and runs so the deques get exercised
+    for i in range(100):
+        val = float(rng.randint(-5, 5)) if i % 10 < 5 else float(i % 10)
+        stats.add(val)
+        vals.append(val)
+        window = vals[-7:]
+        avg = sum(window) / len(window)
+        assert stats.getCount() == len(window)
+        assert stats.getMin() == min(window)
+        assert stats.getMax() == max(window)
+        assert abs(stats.getAvg() - avg) < 1e-9
+        assert abs(stats.getVariance() - sum((v - avg) ** 2 for v in window) / len(window)) < 1e-9
+
+
+def test_window_zero():
+    stats = WindowStats(3)
+    for val in (4.0, 1.0, 9.0, 2.0):
+        stats.add(val)
+    stats.zero()
+    assert stats.getCount() == 0
+    assert stats.getMin() == 0 and stats.getMax() == 0 and stats.getVariance() == 0
+    stats.add(3.0)
+    assert stats.getMin() == stats.getMax() == 3.0
+    assert stats.getCount() == 1
+
+
+def test_window_size():
+    stats = WindowStats(1)
+    stats.add(2.0)
+    stats.add(-1.0)
+    assert stats.getMin() == stats.getMax() == -1.0
+    with pytest.raises(ValueError):
+        WindowStats(0)
+
+
+def test_histogram_buckets():
+    hist = Histogram(0.001, 1000.0, 32)
+    for val in (0.001, 0.0173, 0.5, 1.0, 3.3, 47.0, 999.0):
+        hist.zero()
+        hist.add(val)
+        bound = hist.getPercentile(100)
+        # Reported value is the bucket's upper bound, within 1/subBuckets of the value
+        assert bound >= val
+        assert (bound - val) / val <= 1.0 / 32
+    # Out of range values are clamped into the first and last buckets
+    hist.zero()
+    hist.addMany((0.0, 1e-9, 1e9))
+    assert hist.getPercentiles((50, 100)) == [ hist.getBucketValue(0), hist.getBucketValue(hist.getBucketCount() - 1) ]
+
+
+def test_histogram_percentiles():
+    hist = Histogram()
+    hist.addMany(range(1, 101))
+    assert hist.getCount() == 100
+    p50, p90, p100 = hist.getPercentiles((50, 90, 100))
+    assert 50 <= p50 <= 50 * (1 + 1.0 / 32)
+    assert 90 <= p90 <= 90 * (1 + 1.0 / 32)
+    assert 100 <= p100 <= 100 * (1 + 1.0 / 32)
+    assert Histogram().getPercentiles((50, 99)) == [0.0, 0.0]
+
+
+def test_stats_percentiles():
+    stats = Stats(True)
+    stats.addMany([ 2.0, 3.0, 5.0 ])
+    assert stats.getMin() == 2.0 and stats.getMax() == 5.0
+    assert stats.getAvg() == pytest.approx(10.0 / 3)
+    # Bucket upper bound of largest value is clamped to the max seen
+    assert stats.getPercentile(100) == 5.0
+    assert stats.getPercentile(0) >= 2.0
+    assert Stats().getPercentiles((50, 99)) == [0.0, 0.0]
+
+
+def test_histogram_non_finite():
+    hist = Histogram()
+    hist.add(float("nan"))
+    assert hist.getCount() == 0
+    hist.add(float("inf"))
+    assert hist.getPercentile(100) == hist.getBucketValue(hist.getBucketCount() - 1)
+    hist.add(float("-inf"))
+    hist.add(float("-inf"))
+    assert hist.getCount() == 3
+    assert hist.getPercentile(50) == hist.getBucketValue(0)
+    # A bad sample does not stop Stats from tracking the rest
+    stats = Stats(True)
+    stats.add(float("nan"))
+    stats.add(float("inf"))
+    stats.add(1.0)
+    assert stats.getCount() == 3
+    assert stats.getHistogram().getCount() == 2